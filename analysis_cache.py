@@ -0,0 +1,95 @@
+import functools
+import hashlib
+import pickle
+import threading
+from collections import OrderedDict
+
+# Per-visualizer cap on memoized method results (figures, pattern dicts, reports)
+METHOD_CACHE_SIZE = 64
+
+_cache_init_lock = threading.Lock()
+
+
+def dataset_fingerprint(videos_data):
+    """
+    Return a stable content fingerprint for a list of video dicts
+    """
+    payload = pickle.dumps(videos_data, protocol=4)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _freeze(value):
+    """Convert arguments into a hashable cache key"""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def _instance_cache(obj):
+    """Return the (results, in_flight, lock) triple stored on an instance, creating it once"""
+    state = obj.__dict__.get('_method_cache')
+    if state is None:
+        with _cache_init_lock:
+            state = obj.__dict__.setdefault('_method_cache', (OrderedDict(), {}, threading.Lock()))
+    return state
+
+
+def cached_results(obj, method_name):
+    """(args, kwargs, result) for each memoized result of one method on an instance, oldest first"""
+    cache, _, lock = _instance_cache(obj)
+    with lock:
+        items = list(cache.items())
+    return [(args, dict(kwargs), result) for (name, args, kwargs), result in items if name == method_name]
+
+
+def memoized(method):
+    """
+    Memoize a DataVisualizer (or per-dataset helper) method per instance and arguments
+
+    Instances are cached per dataset fingerprint, so the effective key is
+    (fingerprint, method, arguments). Each instance keeps at most
+    METHOD_CACHE_SIZE results in LRU order. Concurrent calls with the same
+    key (e.g. a prefetching worker and the script thread) compute it once.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        cache, in_flight, lock = _instance_cache(self)
+
+        key = (method.__name__, _freeze(args), _freeze(kwargs))
+        with lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+            pending = in_flight.get(key)
+            if pending is None:
+                in_flight[key] = threading.Event()
+
+        if pending is not None:
+            # Another thread is computing this result; wait for it
+            pending.wait()
+            with lock:
+                if key in cache:
+                    return cache[key]
+            # It failed (or was already evicted): compute without caching
+            return method(self, *args, **kwargs)
+
+        try:
+            result = method(self, *args, **kwargs)
+            with lock:
+                cache[key] = result
+                cache.move_to_end(key)
+                while len(cache) > METHOD_CACHE_SIZE:
+                    cache.popitem(last=False)
+        finally:
+            with lock:
+                in_flight.pop(key).set()
+
+        return result
+
+    return wrapper
@@ -1,22 +1,27 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import matplotlib.pyplot as plt
-import seaborn as sns
-from wordcloud import WordCloud
-import numpy as np
+import uuid
 from datetime import datetime, timedelta
-import re
-import io
-import base64
-from collections import Counter
-import urllib.parse
+from collections import deque
+
+# Plotting libraries are imported on first use inside the display functions
+# and DataVisualizer to keep worker cold start fast (see benchmarks/import_time.py)
 
 from youtube_analyzer import YouTubeAnalyzer
 from url_parser import YouTubeURLParser
 from data_visualizer import DataVisualizer
+from analysis_cache import dataset_fingerprint
+from progress_bus import ProgressEventBus, DEFAULT_HISTORY_SIZE, format_progress
+from collection_worker import CollectionJob, collection_jobs
+from figure_scheduler import prefetch_charts, prefetch_analyses
+from revenue_engine import DEFAULT_RPM
+from time_features import DEFAULT_DISPLAY_TIMEZONE, DISPLAY_TIMEZONES
+from trend_engine import SETTLE_DAYS
+
+DAY_NAMES_KO = {
+    'Monday': '월요일', 'Tuesday': '화요일', 'Wednesday': '수요일',
+    'Thursday': '목요일', 'Friday': '금요일', 'Saturday': '토요일', 'Sunday': '일요일'
+}
 
 # Page configuration
 st.set_page_config(
@@ -167,8 +172,8 @@ st.markdown("""
         left: 100%;
     }
     
-    /* Enhanced Tabs */
-    .stTabs [data-baseweb="tab-list"] {
+    /* Section Navigation (only the radio inside the section_nav container) */
+    .st-key-section_nav div[role="radiogroup"] {
         gap: 12px;
         background: rgba(255, 255, 255, 0.1);
         padding: 8px;
@@ -176,24 +181,19 @@ st.markdown("""
         backdrop-filter: blur(10px);
     }
     
-    .stTabs [data-baseweb="tab"] {
-        height: 3.5rem;
-        padding: 12px 24px;
+    .st-key-section_nav div[role="radiogroup"] > label {
+        padding: 8px 16px;
         background: rgba(255, 255, 255, 0.1);
         border-radius: 16px;
         border: 1px solid rgba(255, 255, 255, 0.2);
         font-weight: 600;
-        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-        backdrop-filter: blur(10px);
-        color: rgba(255, 255, 255, 0.8);
     }
     
-    .stTabs [aria-selected="true"] {
-        background: linear-gradient(135deg, #FF0000 0%, #FF6B6B 100%);
-        color: white !important;
+    .st-key-section_nav div[role="radiogroup"] > label:has(input:checked) {
+        background: var(--primary);
+        border-color: var(--primary-dark);
+        color: white;
         box-shadow: var(--shadow-lg);
-        border: 1px solid rgba(255, 255, 255, 0.3);
-        transform: translateY(-2px);
     }
     
     /* Glassmorphism Cards */
@@ -381,8 +381,8 @@ st.markdown("""
             padding: 1.5rem;
         }
         
-        .stTabs [data-baseweb="tab"] {
-            padding: 10px 16px;
+        div[role="radiogroup"] > label {
+            padding: 6px 12px;
             font-size: 0.9rem;
         }
         
@@ -440,9 +440,19 @@ def initialize_session_state():
     if 'analysis_complete' not in st.session_state:
         st.session_state.analysis_complete = False
     if 'progress_messages' not in st.session_state:
-        st.session_state.progress_messages = []
+        st.session_state.progress_messages = deque(maxlen=DEFAULT_HISTORY_SIZE)
     if 'error_message' not in st.session_state:
         st.session_state.error_message = None
+    if 'dataset_version' not in st.session_state:
+        st.session_state.dataset_version = 0
+    if 'channel_metrics' not in st.session_state:
+        st.session_state.channel_metrics = None
+    if 'dataset_fingerprint' not in st.session_state:
+        st.session_state.dataset_fingerprint = None
+    if 'session_key' not in st.session_state:
+        st.session_state.session_key = uuid.uuid4().hex
+    if 'display_timezone' not in st.session_state:
+        st.session_state.display_timezone = DEFAULT_DISPLAY_TIMEZONE
 
 def show_progress(message):
     """Add progress message to session state"""
@@ -454,7 +464,7 @@ def display_progress():
     if st.session_state.progress_messages:
         st.markdown('<div class="progress-container">', unsafe_allow_html=True)
         st.subheader("📈 분석 진행 상황")
-        for message in st.session_state.progress_messages[-10:]:  # Show last 10 messages
+        for message in list(st.session_state.progress_messages)[-10:]:  # Show last 10 messages
             st.text(message)
         st.markdown('</div>', unsafe_allow_html=True)
 
@@ -548,6 +558,15 @@ def main():
                 date_from = st.date_input("시작 날짜", value=datetime.now() - timedelta(days=365))
                 date_to = st.date_input("종료 날짜", value=datetime.now())
         
+        # Display timezone for upload hours, weekdays and months (no re-collection needed)
+        with st.expander("🕐 표시 시간대"):
+            st.selectbox(
+                "시간대",
+                DISPLAY_TIMEZONES,
+                key="display_timezone",
+                help="업로드 시간·요일·월 분석에 사용할 시간대 (변경 시 재수집 없이 다시 계산)"
+            )
+        
         # Performance filters
         with st.expander("🎯 성과 필터"):
             min_views = st.number_input("최소 조회수", min_value=0, value=0)
@@ -577,9 +596,10 @@ def main():
     
     # Main content area
     if analyze_button and api_key and channel_input:
-        st.session_state.progress_messages = []
+        # Progress events are coalesced to a fixed rate and kept in a bounded ring buffer
+        progress_bus = ProgressEventBus()
+        st.session_state.progress_messages = progress_bus.messages
         st.session_state.error_message = None
-        st.session_state.analysis_complete = False
         
         # Initialize analyzer
         show_progress("유튜브 분석기 초기화 중...")
@@ -603,82 +623,146 @@ def main():
             
             show_progress(f"채널 발견: {channel_data.get('title', '알 수 없음')}")
             
-            # Create progress container
-            progress_container = st.container()
-            with progress_container:
-                display_progress()
-            
-            # Collect video data
-            show_progress("영상 데이터 수집 중... 시간이 소요될 수 있습니다.")
-            
-            # Create a progress bar
-            progress_bar = st.progress(0)
-            status_text = st.empty()
-            
-            def progress_callback(current, total, message):
-                progress = min(current / total, 1.0) if total > 0 else 0
-                progress_bar.progress(progress)
-                status_text.text(f"{message} ({current}/{total})")
-                show_progress(f"{message} ({current}/{total})")
-            
-            videos_data = st.session_state.analyzer.collect_all_videos(
-                channel_data['id'],
-                max_results=max_videos,
-                include_shorts=include_shorts,
-                include_long_form=include_long_form,
-                progress_callback=progress_callback
+            # Collect video data in the background so the page stays interactive
+            show_progress("영상 데이터 수집 중... 백그라운드에서 진행되며 기존 결과는 계속 볼 수 있습니다.")
+            collection_jobs.submit(
+                st.session_state.session_key,
+                CollectionJob(
+                    st.session_state.analyzer,
+                    channel_data,
+                    {
+                        'max_results': max_videos,
+                        'include_shorts': include_shorts,
+                        'include_long_form': include_long_form
+                    },
+                    progress_bus=progress_bus
+                )
             )
             
-            if not videos_data:
-                display_error("이 채널에서 영상을 찾을 수 없습니다.")
-                return
-            
-            progress_bar.progress(1.0)
-            status_text.text(f"분석 완료! {len(videos_data)}개 영상을 발견했습니다.")
-            
-            # Store data in session state
-            st.session_state.channel_data = {
-                'channel_info': channel_data,
-                'videos': videos_data
-            }
-            st.session_state.analysis_complete = True
-            
-            display_success(f"{channel_data.get('title', '알 수 없는')} 채널의 {len(videos_data)}개 영상 분석을 성공적으로 완료했습니다!")
-            
         except Exception as e:
             display_error(f"분석 실패: {str(e)}")
             st.error(f"상세 오류: {str(e)}")
             return
     
+    # Poll the background collection job, if any
+    job = collection_jobs.get(st.session_state.session_key)
+    if job is not None:
+        if job.is_running():
+            display_collection_status()
+        else:
+            finish_collection_job(job)
+    
     # Display results if analysis is complete
     if st.session_state.analysis_complete and st.session_state.channel_data:
         display_analysis_results()
 
+@st.fragment(run_every=1)
+def display_collection_status():
+    """Poll the background collection job and show its progress"""
+    job = collection_jobs.get(st.session_state.session_key)
+    if job is None or not job.is_running():
+        # Finished: rerun the whole app so the results are picked up
+        st.rerun()
+    
+    snapshot = job.latest_progress()
+    st.progress(snapshot['progress'] if snapshot else 0)
+    st.text(format_progress(snapshot) if snapshot else "영상 데이터 수집 준비 중...")
+    display_progress()
+    
+    collected = job.collected_count()
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if st.button("⏹️ 수집 중단", key="cancel_collection", disabled=job.is_cancelled(), use_container_width=True):
+            job.cancel()
+            show_progress("수집 중단 요청됨. 지금까지 수집된 영상으로 분석합니다.")
+    
+    with col2:
+        if st.button(f"👀 중간 결과 보기 ({collected:,}개)", key="load_partial_results", disabled=collected == 0, use_container_width=True):
+            store_channel_data(job.channel_data, job.partial_videos())
+            st.rerun()
+
+def finish_collection_job(job):
+    """Store the results of a finished background collection job"""
+    collection_jobs.pop(st.session_state.session_key)
+    
+    if job.error:
+        display_error(f"분석 실패: {job.error}")
+        st.error(f"상세 오류: {job.error}")
+        return
+    
+    videos_data = job.result or []
+    if not videos_data:
+        display_error("이 채널에서 영상을 찾을 수 없습니다.")
+        return
+    
+    store_channel_data(job.channel_data, videos_data)
+    
+    channel_title = job.channel_data.get('title', '알 수 없는')
+    if job.state == 'cancelled':
+        display_success(f"수집이 중단되었습니다. {channel_title} 채널의 {len(videos_data)}개 영상으로 분석을 완료했습니다!")
+    else:
+        display_success(f"{channel_title} 채널의 {len(videos_data)}개 영상 분석을 성공적으로 완료했습니다!")
+
+def store_channel_data(channel_data, videos_data):
+    """Store a (possibly partial) dataset in session state as a new dataset version"""
+    st.session_state.channel_data = {
+        'channel_info': channel_data,
+        'videos': videos_data
+    }
+    st.session_state.dataset_version += 1
+    st.session_state.analysis_complete = True
+
+# Visualizers (with their memoized charts and analyses) shared across reruns and sessions
+VISUALIZER_CACHE_ENTRIES = 8
+
+@st.cache_resource(max_entries=VISUALIZER_CACHE_ENTRIES, show_spinner=False)
+def load_visualizer(fingerprint, timezone, _videos_data):
+    """Build a DataVisualizer once per dataset fingerprint and display timezone"""
+    if timezone == DEFAULT_DISPLAY_TIMEZONE:
+        return DataVisualizer(_videos_data, timezone)
+    # Other timezones reuse the default visualizer's frame instead of rebuilding it
+    return load_visualizer(fingerprint, DEFAULT_DISPLAY_TIMEZONE, _videos_data).with_timezone(timezone)
+
+def get_visualizer():
+    """Get the cached visualizer for the current dataset"""
+    cached = st.session_state.dataset_fingerprint
+    if cached is None or cached[0] != st.session_state.dataset_version:
+        cached = (st.session_state.dataset_version, dataset_fingerprint(st.session_state.channel_data['videos']))
+        st.session_state.dataset_fingerprint = cached
+    return load_visualizer(cached[1], st.session_state.display_timezone, st.session_state.channel_data['videos'])
+
+def get_channel_metrics(visualizer):
+    """Get header KPIs, computed once per dataset version and display timezone"""
+    cached = st.session_state.channel_metrics
+    version = (st.session_state.dataset_version, visualizer.timezone)
+    if cached is None or cached[0] != version:
+        cached = (version, visualizer.get_channel_metrics())
+        st.session_state.channel_metrics = cached
+    return cached[1]
+
 def display_analysis_results():
     """Display comprehensive analysis results"""
     channel_info = st.session_state.channel_data['channel_info']
-    videos_data = st.session_state.channel_data['videos']
     
-    # Create visualizer
-    visualizer = DataVisualizer(videos_data)
+    # Get visualizer (memoized per dataset fingerprint)
+    visualizer = get_visualizer()
     
     st.header(f"📊 {channel_info.get('title', '알 수 없는 채널')} 분석 결과")
     
     # Channel overview with enhanced metrics
     col1, col2, col3, col4 = st.columns(4)
     
-    total_videos = len(videos_data)
-    total_views = sum(video.get('view_count', 0) for video in videos_data)
-    total_likes = sum(video.get('like_count', 0) for video in videos_data)
-    total_comments = sum(video.get('comment_count', 0) for video in videos_data)
-    avg_views = total_views / total_videos if total_videos > 0 else 0
-    
-    shorts_count = sum(1 for video in videos_data if video.get('is_short', False))
-    long_form_count = total_videos - shorts_count
-    
-    # Calculate engagement metrics
-    total_engagement = total_likes + total_comments
-    avg_engagement_rate = (total_engagement / total_views * 100) if total_views > 0 else 0
+    # Header KPIs from a single pass over the columnar data, cached per dataset
+    metrics = get_channel_metrics(visualizer)
+    total_videos = metrics['total_videos']
+    total_views = metrics['total_views']
+    total_likes = metrics['total_likes']
+    total_comments = metrics['total_comments']
+    avg_views = metrics['avg_views']
+    shorts_count = metrics['shorts_count']
+    long_form_count = metrics['long_form_count']
+    avg_engagement_rate = metrics['avg_engagement_rate']
     
     with col1:
         st.metric("총 영상 수", f"{total_videos:,}")
@@ -708,112 +792,134 @@ def display_analysis_results():
         st.metric("평균 참여율", f"{avg_engagement_rate:.2f}%")
     
     with col7:
-        # Calculate average upload frequency
-        if total_videos > 1:
-            date_range = (max(video['published_at'] for video in videos_data) - 
-                         min(video['published_at'] for video in videos_data)).days
-            upload_frequency = date_range / total_videos if date_range > 0 else 0
-            st.metric("평균 업로드 간격", f"{upload_frequency:.1f}일")
+        # Average upload frequency
+        if metrics['upload_frequency_days'] is not None:
+            st.metric("평균 업로드 간격", f"{metrics['upload_frequency_days']:.1f}일")
         else:
             st.metric("평균 업로드 간격", "N/A")
     
     with col8:
         # Most successful video
-        if videos_data:
-            best_video = max(videos_data, key=lambda x: x.get('view_count', 0))
-            st.metric("최고 조회수", f"{best_video.get('view_count', 0):,}")
-    
-    # Create enhanced analysis tabs with new features
-    tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8, tab9, tab10 = st.tabs([
-        "📈 성과 개요",
-        "📅 업로드 패턴", 
-        "🔥 인기 영상",
-        "🔤 키워드 분석",
-        "🎯 성공 패턴",
-        "💰 수익 분석",
-        "🤖 AI 추천",
-        "📊 상세 데이터",
-        "🔮 트렌드 예측",
-        "📋 내보내기 & 리포트"
-    ])
-    
-    with tab1:
-        display_performance_overview(visualizer)
-    
-    with tab2:
-        display_upload_patterns(visualizer)
-    
-    with tab3:
-        display_top_videos(visualizer)
-    
-    with tab4:
-        display_keywords_analysis(visualizer)
-    
-    with tab5:
-        display_success_patterns(visualizer)
-    
-    with tab6:
-        display_revenue_analysis(visualizer, channel_info)
-    
-    with tab7:
-        display_ai_recommendations(visualizer, channel_info)
-    
-    with tab8:
-        display_detailed_data()
+        if total_videos:
+            st.metric("최고 조회수", f"{metrics['best_video_views']:,}")
+    
+    # Analysis sections: only the selected section's display function runs on a rerun,
+    # the others stay memoized on the visualizer for fast switching
+    sections = {
+        "📈 성과 개요": lambda: display_performance_overview(visualizer),
+        "📅 업로드 패턴": lambda: display_upload_patterns(visualizer),
+        "🔥 인기 영상": lambda: display_top_videos(visualizer),
+        "🔤 키워드 분석": lambda: display_keywords_analysis(visualizer),
+        "🎯 성공 패턴": lambda: display_success_patterns(visualizer),
+        "💰 수익 분석": lambda: display_revenue_analysis(visualizer, channel_info),
+        "🤖 AI 추천": lambda: display_ai_recommendations(visualizer, channel_info),
+        "📊 상세 데이터": lambda: display_detailed_data(visualizer),
+        "🔮 트렌드 예측": lambda: display_trend_prediction(visualizer),
+        "📋 내보내기 & 리포트": lambda: display_export_options(visualizer)
+    }
     
-    with tab9:
-        display_trend_prediction(visualizer)
+    with st.container(key="section_nav"):
+        active_section = st.radio(
+            "분석 섹션",
+            list(sections.keys()),
+            horizontal=True,
+            key="active_section",
+            label_visibility="collapsed"
+        )
     
-    with tab10:
-        display_export_options(visualizer)
+    st.divider()
+    sections[active_section]()
+
+def display_chart(visualizer, chart, **params):
+    """Render a DataVisualizer chart from its cached payload"""
+    payload = visualizer.get_figure_payload(chart, **params)
+    if payload is None:
+        return False
+    
+    st.plotly_chart(payload.figure, use_container_width=True)
+    return True
 
 def display_performance_overview(visualizer):
     """Display performance overview charts"""
     st.subheader("📈 성과 개요")
     
+    # Build the tab's independent figures concurrently; they are rendered below in layout order
+    prefetch_charts(visualizer, [
+        ('create_views_distribution', {'log_scale': st.session_state.get("views_log_scale", True)}),
+        ('create_engagement_chart', {}),
+        ('create_shorts_vs_longform_comparison', {}),
+        ('create_duration_views_correlation', {})
+    ])
+    
     # Views distribution
     col1, col2 = st.columns(2)
     
     with col1:
         st.subheader("조회수 분포")
-        fig = visualizer.create_views_distribution()
-        st.plotly_chart(fig, use_container_width=True)
+        log_scale = st.checkbox("로그 스케일", value=True, key="views_log_scale")
+        display_chart(visualizer, 'create_views_distribution', log_scale=log_scale)
     
     with col2:
         st.subheader("참여율 분석")
-        fig = visualizer.create_engagement_chart()
-        st.plotly_chart(fig, use_container_width=True)
+        display_chart(visualizer, 'create_engagement_chart')
     
     # Performance comparison: Shorts vs Long-form
     st.subheader("📊 쇼츠 vs 롱폼 성과 비교")
-    fig = visualizer.create_shorts_vs_longform_comparison()
-    st.plotly_chart(fig, use_container_width=True)
+    display_chart(visualizer, 'create_shorts_vs_longform_comparison')
     
     # Duration vs Views correlation
     st.subheader("⏱️ 영상 길이와 조회수 상관관계")
-    fig = visualizer.create_duration_views_correlation()
-    st.plotly_chart(fig, use_container_width=True)
+    display_chart(visualizer, 'create_duration_views_correlation')
 
 def display_upload_patterns(visualizer):
     """Display upload pattern analysis"""
     st.subheader("📅 업로드 패턴 분석")
     
+    # Build the tab's independent figures and analyses concurrently
+    prefetch_charts(visualizer, [
+        ('create_monthly_trends', {}),
+        ('create_weekday_analysis', {}),
+        ('create_hourly_analysis', {}),
+        ('create_upload_heatmap', {})
+    ])
+    prefetch_analyses(visualizer, ['analyze_upload_consistency'])
+    
     # Monthly upload trends
     st.subheader("📊 월별 업로드 트렌드")
-    fig = visualizer.create_monthly_trends()
-    st.plotly_chart(fig, use_container_width=True)
+    display_chart(visualizer, 'create_monthly_trends')
     
     col1, col2 = st.columns(2)
     
     with col1:
         st.subheader("📅 요일별 업로드 패턴")
-        fig = visualizer.create_weekday_analysis()
-        st.plotly_chart(fig, use_container_width=True)
+        display_chart(visualizer, 'create_weekday_analysis')
     
     with col2:
         st.subheader("🕐 시간대별 업로드 패턴")
-        fig = visualizer.create_hourly_analysis()
-        st.plotly_chart(fig, use_container_width=True)
+        display_chart(visualizer, 'create_hourly_analysis')
+    
+    # Weekday x hour performance over all videos
+    st.subheader("🗓️ 요일 × 시간대 성과 히트맵")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        heatmap_metric = st.selectbox(
+            "히트맵 지표",
+            ["view_count", "engagement_rate"],
+            format_func=lambda x: {"view_count": "👁️ 조회수", "engagement_rate": "📊 참여율"}[x],
+            key="heatmap_metric"
+        )
+    
+    with col2:
+        heatmap_statistic = st.selectbox(
+            "히트맵 통계",
+            ["shrunk", "mean", "median"],
+            format_func=lambda x: {"shrunk": "보정 평균 (채널 평균으로 수축)", "mean": "평균", "median": "중앙값"}[x],
+            key="heatmap_statistic"
+        )
+    
+    display_chart(visualizer, 'create_upload_heatmap', metric=heatmap_metric, statistic=heatmap_statistic)
+    st.caption("보정 평균은 영상이 적은 시간대를 채널 평균 쪽으로 당겨 우연한 고성과를 걸러냅니다")
     
     # Upload consistency analysis
     st.subheader("📈 업로드 일관성 분석")
@@ -841,18 +947,26 @@ def display_top_videos(visualizer):
     """Display top performing videos"""
     st.subheader("🔥 인기 영상 분석")
     
-    # Top videos by different metrics
+    # Top videos by different metrics (outlier score only when the dataset can be scored)
+    metric_options = ["view_count", "like_count", "comment_count", "engagement_rate"]
+    if visualizer.get_outlier_engine().can_score:
+        metric_options.append("outlier_score")
+    
     metric_type = st.selectbox(
         "상위 영상 정렬 기준 선택",
-        ["view_count", "like_count", "comment_count", "engagement_rate"],
+        metric_options,
         format_func=lambda x: {
             "view_count": "👁️ 조회수",
             "like_count": "👍 좋아요", 
             "comment_count": "💬 댓글수",
-            "engagement_rate": "📊 참여율"
+            "engagement_rate": "📊 참여율",
+            "outlier_score": "🚀 기대 대비 성과"
         }[x]
     )
     
+    if "outlier_score" not in metric_options:
+        st.caption("ℹ️ 영상 수가 적거나 성과 차이가 없어 '기대 대비 성과' 기준은 사용할 수 없습니다.")
+    
     # Number of top videos to display
     top_count = st.slider("표시할 상위 영상 수", min_value=5, max_value=50, value=20)
     
@@ -866,6 +980,9 @@ def display_top_videos(visualizer):
         display_df = df[['title', 'published_at', 'view_count', 'like_count', 'comment_count', 'duration_formatted', 'is_short']].copy()
         display_df.columns = ['제목', '업로드일', '조회수', '좋아요', '댓글수', '길이', '유형']
         display_df['유형'] = ['쇼츠' if x else '롱폼' for x in display_df['유형']]
+        if metric_type == "outlier_score":
+            display_df['기대 조회수'] = [f"{x:,.0f}" for x in df['expected_views']]
+            display_df['성과 점수'] = [f"{x:+.1f}" for x in df['outlier_score']]
         
         # Format numbers with commas
         for col in ['조회수', '좋아요', '댓글수']:
@@ -883,12 +1000,12 @@ def display_top_videos(visualizer):
             "view_count": "조회수",
             "like_count": "좋아요",
             "comment_count": "댓글수",
-            "engagement_rate": "참여율"
+            "engagement_rate": "참여율",
+            "outlier_score": "기대 대비 성과"
         }[metric_type]
         
         st.subheader(f"📊 {metric_name} 기준 상위 10개 영상")
-        fig = visualizer.create_top_videos_chart(metric=metric_type, count=10)
-        st.plotly_chart(fig, use_container_width=True)
+        display_chart(visualizer, 'create_top_videos_chart', metric=metric_type, count=10)
         
         # Performance insights
         if len(top_videos) >= 3:
@@ -951,13 +1068,16 @@ def display_success_patterns(visualizer):
                 for time_info in patterns['best_times'][:5]:
                     # Handle both dict and other formats safely
                     if isinstance(time_info, dict):
+                        day = time_info.get('day', '')
                         hour = time_info.get('hour', 0)
                         count = time_info.get('count', 0)
                         avg_views = time_info.get('avg_views', 0)
+                        median_views = time_info.get('median_views', 0)
                         times_data.append({
-                            '시간대': f"{hour}시",
+                            '시간대': f"{DAY_NAMES_KO.get(day, day)} {hour}시",
                             '영상수': count,
-                            '평균 조회수': f"{avg_views:,.0f}"
+                            '보정 평균 조회수': f"{avg_views:,.0f}",
+                            '중간 조회수': f"{median_views:,.0f}"
                         })
                 
                 if times_data:
@@ -967,6 +1087,35 @@ def display_success_patterns(visualizer):
             else:
                 st.info("업로드 시간 패턴을 찾을 수 없습니다.")
     
+    # Breakout videos relative to the channel's own age-adjusted baseline
+    if patterns and 'overperformers' in patterns:
+        st.subheader("🚀 기대 이상 성과 영상")
+        summary = patterns['outlier_summary']
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.metric("바이럴 영상", f"{summary['viral']}개")
+        with col2:
+            st.metric("기대 이상 영상", f"{summary['overperformer']}개")
+        with col3:
+            st.metric("기대 이하 영상", f"{summary['underperformer']}개")
+        
+        if patterns['overperformers']:
+            st.dataframe(pd.DataFrame([
+                {
+                    '제목': video['title'],
+                    '업로드일': video['published_at'].strftime('%Y-%m-%d'),
+                    '조회수': f"{video['view_count']:,}",
+                    '기대 조회수': f"{video['expected_views']:,.0f}",
+                    '성과 점수': f"{video['outlier_score']:+.1f}",
+                    '구분': '바이럴' if video['outlier_label'] == 'viral' else '기대 이상'
+                }
+                for video in patterns['overperformers']
+            ]), use_container_width=True, hide_index=True)
+        else:
+            st.info("채널 기준선을 크게 넘는 영상이 없습니다.")
+        st.caption("성과 점수는 업로드 시기가 비슷한 영상들의 중앙값(업로드 경과일 보정) 대비 로그 조회수 차이를 MAD로 나눈 값입니다")
+    
     # Best performing video length analysis
     st.subheader("⏱️ 최적 영상 길이 분석")
     videos_data = visualizer.videos_data
@@ -1015,21 +1164,19 @@ def display_success_patterns(visualizer):
     st.subheader("📝 제목 패턴 분석")
     if videos_data:
         # Analyze title characteristics of top performing videos
-        top_videos = sorted(videos_data, key=lambda x: x.get('view_count', 0), reverse=True)[:20]
+        title_stats = visualizer.get_insight_engine().title_patterns(top_n=20)
         
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            avg_title_length = sum(len(v.get('title', '')) for v in top_videos) / len(top_videos)
-            st.metric("상위 영상 평균 제목 길이", f"{avg_title_length:.0f}자")
-        
-        with col2:
-            question_titles = sum(1 for v in top_videos if '?' in v.get('title', ''))
-            st.metric("물음표 포함 제목", f"{question_titles}개")
-        
-        with col3:
-            exclamation_titles = sum(1 for v in top_videos if '!' in v.get('title', ''))
-            st.metric("느낌표 포함 제목", f"{exclamation_titles}개")
+        if title_stats:
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                st.metric("상위 영상 평균 제목 길이", f"{title_stats['avg_length']:.0f}자")
+            
+            with col2:
+                st.metric("물음표 포함 제목", f"{title_stats['question_count']}개")
+            
+            with col3:
+                st.metric("느낌표 포함 제목", f"{title_stats['exclamation_count']}개")
 
 def display_trend_prediction(visualizer):
     """Display trend prediction and future insights"""
@@ -1040,58 +1187,47 @@ def display_trend_prediction(visualizer):
         st.warning("트렌드 예측을 위해서는 최소 10개 이상의 영상이 필요합니다.")
         return
     
-    # Growth trend analysis
+    # Growth trend analysis (monthly series, growth and forecast from the trend engine)
     st.subheader("📈 성장 트렌드 분석")
     
-    # Sort videos by date
-    sorted_videos = sorted(videos_data, key=lambda x: x.get('published_at'))
-    
-    # Calculate monthly growth
-    monthly_data = {}
-    for video in sorted_videos:
-        month_key = video['published_at'].strftime('%Y-%m')
-        if month_key not in monthly_data:
-            monthly_data[month_key] = {
-                'count': 0,
-                'total_views': 0,
-                'total_likes': 0,
-                'total_comments': 0
-            }
-        monthly_data[month_key]['count'] += 1
-        monthly_data[month_key]['total_views'] += video.get('view_count', 0)
-        monthly_data[month_key]['total_likes'] += video.get('like_count', 0)
-        monthly_data[month_key]['total_comments'] += video.get('comment_count', 0)
+    trend_engine = visualizer.get_trend_engine()
+    growth = trend_engine.growth_summary('view_count')
     
-    if len(monthly_data) >= 3:
-        months = sorted(monthly_data.keys())
-        recent_months = months[-3:]
-        
-        col1, col2, col3 = st.columns(3)
+    if growth is not None:
+        col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            recent_avg_views = sum(monthly_data[m]['total_views'] for m in recent_months) / len(recent_months)
-            older_months = months[:-3] if len(months) > 3 else months[:3]
-            older_avg_views = sum(monthly_data[m]['total_views'] for m in older_months) / len(older_months) if older_months else recent_avg_views
-            
-            growth_rate = ((recent_avg_views - older_avg_views) / older_avg_views * 100) if older_avg_views > 0 else 0
-            st.metric("최근 3개월 성장률", f"{growth_rate:+.1f}%")
+            st.metric("최근 3개월 성장률", f"{growth['recent_growth_pct']:+.1f}%")
         
         with col2:
-            recent_upload_count = sum(monthly_data[m]['count'] for m in recent_months)
-            st.metric("최근 3개월 업로드", f"{recent_upload_count}개")
+            st.metric("최근 3개월 업로드", f"{growth['recent_uploads']}개")
         
         with col3:
-            if len(recent_months) >= 2:
-                last_month_views = monthly_data[recent_months[-1]]['total_views']
-                prev_month_views = monthly_data[recent_months[-2]]['total_views']
-                month_growth = ((last_month_views - prev_month_views) / prev_month_views * 100) if prev_month_views > 0 else 0
-                st.metric("전월 대비 성장률", f"{month_growth:+.1f}%")
+            st.metric("전월 대비 성장률", f"{growth['month_growth_pct']:+.1f}%")
+        
+        with col4:
+            st.metric("3개월 이동 성장률", f"{growth['rolling_growth_pct']:+.1f}%")
+        
+        display_chart(visualizer, 'create_views_forecast_chart', horizon=3)
+        
+        forecast = trend_engine.forecast('view_count', horizon=3)
+        if not forecast.empty:
+            next_month = forecast.iloc[0]
+            st.caption(
+                f"📌 {next_month['month']} 예상 조회수: {next_month['forecast']:,.0f}회 "
+                f"(80% 구간 {next_month['lower']:,.0f} ~ {next_month['upper']:,.0f}) · "
+                "최근 24개월 추세 기반 로버스트 선형 예측"
+            )
+        st.caption(
+            "ℹ️ 조회수는 업로드 월 기준 누적값이라 최근 달은 아직 집계 중입니다. "
+            f"성장률과 예측은 {growth['through_month']}까지, 끝난 지 {SETTLE_DAYS}일이 지난 달만 사용합니다."
+        )
     
     # Content recommendations
     st.subheader("💡 콘텐츠 추천")
     
     # Analyze successful content patterns
-    top_performing = sorted(videos_data, key=lambda x: x.get('view_count', 0), reverse=True)[:10]
+    insights = visualizer.get_insight_engine()
     
     col1, col2 = st.columns(2)
     
@@ -1099,41 +1235,23 @@ def display_trend_prediction(visualizer):
         st.write("**성공 요인 분석:**")
         
         # Most successful video type
-        shorts_performance = [v for v in top_performing if v.get('is_short', False)]
-        longform_performance = [v for v in top_performing if not v.get('is_short', False)]
-        
-        if len(shorts_performance) > len(longform_performance):
+        if insights.format_advantage()['recommended'] == 'short':
             st.info("🎯 쇼츠 콘텐츠가 더 높은 성과를 보입니다")
         else:
             st.info("🎯 롱폼 콘텐츠가 더 높은 성과를 보입니다")
         
         # Best upload day
-        day_performance = {}
-        for video in top_performing:
-            day = video['published_at'].strftime('%A')
-            if day not in day_performance:
-                day_performance[day] = 0
-            day_performance[day] += 1
-        
-        if day_performance:
-            best_day = max(day_performance.keys(), key=lambda x: day_performance[x])
-            day_names = {
-                'Monday': '월요일', 'Tuesday': '화요일', 'Wednesday': '수요일',
-                'Thursday': '목요일', 'Friday': '금요일', 'Saturday': '토요일', 'Sunday': '일요일'
-            }
-            st.info(f"📅 {day_names.get(best_day, best_day)}에 업로드한 영상의 성과가 좋습니다")
+        best_day = insights.best_upload_slot()['day']
+        st.info(f"📅 {DAY_NAMES_KO.get(best_day, best_day)}에 업로드한 영상의 성과가 좋습니다")
     
     with col2:
         st.write("**개선 제안:**")
         
         # Upload consistency
-        upload_gaps = []
-        for i in range(1, len(sorted_videos)):
-            gap = (sorted_videos[i]['published_at'] - sorted_videos[i-1]['published_at']).days
-            upload_gaps.append(gap)
+        upload_gaps = insights.gap_stats()['history']
         
         if upload_gaps:
-            avg_gap = sum(upload_gaps) / len(upload_gaps)
+            avg_gap = upload_gaps['mean_days']
             if avg_gap > 7:
                 st.warning("⚡ 업로드 주기를 더 짧게 하면 성장에 도움이 될 수 있습니다")
             elif avg_gap < 1:
@@ -1141,9 +1259,14 @@ def display_trend_prediction(visualizer):
             else:
                 st.success("✅ 적절한 업로드 주기를 유지하고 있습니다")
         
+            st.caption(
+                f"업로드 간격: 평균 {upload_gaps['mean_days']:.1f}일 · 중앙값 {upload_gaps['median_days']:.1f}일 · "
+                f"상위 10% {upload_gaps['p90_days']:.1f}일 이상 · 최장 {upload_gaps['max_days']:.0f}일"
+            )
+        
         # Engagement rate analysis
-        recent_videos = sorted_videos[-10:] if len(sorted_videos) >= 10 else sorted_videos
-        avg_engagement = sum(v.get('engagement_rate', 0) for v in recent_videos) / len(recent_videos)
+        recent_videos = visualizer.get_rank_index().top_rows('published_at', 10)
+        avg_engagement = recent_videos['engagement_rate'].fillna(0).mean()
         
         if avg_engagement < 2:
             st.warning("💬 시청자 참여도가 낮습니다. 댓글을 유도하는 질문이나 상호작용을 늘려보세요")
@@ -1161,17 +1284,41 @@ def display_revenue_analysis(visualizer, channel_info):
         st.warning("수익 분석을 위한 데이터가 없습니다.")
         return
     
-    # Calculate revenue estimates
-    total_views = sum(video.get('view_count', 0) for video in videos_data)
     subscriber_count = channel_info.get('subscriber_count', 0)
     
+    # RPM assumptions (USD per 1,000 views) per format
+    with st.expander("⚙️ RPM 가정 (1,000회 조회당 수익, USD)"):
+        col1, col2 = st.columns(2)
+        with col1:
+            short_rpm = st.number_input(
+                "쇼츠 RPM (중앙값)", min_value=0.0, max_value=20.0,
+                value=DEFAULT_RPM['short'].median, step=0.05, key="short_rpm"
+            )
+        with col2:
+            long_form_rpm = st.number_input(
+                "롱폼 RPM (중앙값)", min_value=0.0, max_value=50.0,
+                value=DEFAULT_RPM['long_form'].median, step=0.1, key="long_form_rpm"
+            )
+        st.caption(
+            "시나리오 분석은 RPM의 90% 분위가 중앙값의 "
+            f"쇼츠 {DEFAULT_RPM['short'].p90_ratio:.1f}배, 롱폼 {DEFAULT_RPM['long_form'].p90_ratio:.1f}배라고 가정합니다."
+        )
+    
+    # Keep each format's default spread around the chosen median
+    rpm = {
+        'short': DEFAULT_RPM['short'].with_median(short_rpm),
+        'long_form': DEFAULT_RPM['long_form'].with_median(long_form_rpm)
+    }
+    
+    revenue_engine = visualizer.get_revenue_engine()
+    revenue = revenue_engine.summary(rpm)
+    ad_revenue = revenue['total_revenue']
+    
     # Revenue calculation (rough estimates based on industry averages)
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        # Ad revenue estimation (RPM: Revenue per Mille)
-        estimated_rpm = 1.5  # $1-3 per 1000 views average
-        ad_revenue = (total_views / 1000) * estimated_rpm
+        # Ad revenue estimation at the median RPM of each format
         st.metric("예상 광고 수익", f"${ad_revenue:,.0f}")
     
     with col2:
@@ -1183,30 +1330,34 @@ def display_revenue_analysis(visualizer, channel_info):
             st.metric("스폰서십 잠재가치", "N/A")
     
     with col3:
-        # Monthly earning potential
-        from datetime import timezone
-        now = datetime.now(timezone.utc)
-        recent_videos = []
-        for v in videos_data:
-            pub_date = v['published_at']
-            if hasattr(pub_date, 'tz_localize'):
-                pub_date = pub_date.tz_localize('UTC') if pub_date.tz is None else pub_date
-            elif not hasattr(pub_date, 'tzinfo') or pub_date.tzinfo is None:
-                pub_date = pub_date.replace(tzinfo=timezone.utc)
-            
-            if (now - pub_date).days <= 30:
-                recent_videos.append(v)
-        monthly_views = sum(v.get('view_count', 0) for v in recent_videos)
-        monthly_revenue = (monthly_views / 1000) * estimated_rpm
-        st.metric("월 예상 수익", f"${monthly_revenue:,.0f}")
+        # Revenue of videos uploaded in the last 30 days
+        st.metric("월 예상 수익", f"${revenue['recent_revenue']:,.0f}")
     
     with col4:
-        # Growth potential
-        if len(videos_data) >= 10:
-            recent_avg = sum(v.get('view_count', 0) for v in videos_data[-5:]) / 5
-            older_avg = sum(v.get('view_count', 0) for v in videos_data[-10:-5]) / 5
-            growth = ((recent_avg - older_avg) / older_avg * 100) if older_avg > 0 else 0
-            st.metric("성장률", f"{growth:+.1f}%")
+        # Growth potential: newest 5 uploads vs the 5 before them
+        if revenue['growth_pct'] is not None:
+            st.metric("성장률", f"{revenue['growth_pct']:+.1f}%")
+    
+    # Monte Carlo scenarios over uncertain RPM
+    st.subheader("🎲 수익 시나리오 (10,000회 시뮬레이션)")
+    scenarios = revenue_engine.simulate(rpm)
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("보수적 (하위 10%)", f"${scenarios['total'][10]:,.0f}",
+                  help=f"최근 30일: ${scenarios['recent'][10]:,.0f}")
+    
+    with col2:
+        st.metric("중간값", f"${scenarios['total'][50]:,.0f}",
+                  help=f"최근 30일: ${scenarios['recent'][50]:,.0f}")
+    
+    with col3:
+        st.metric("낙관적 (상위 10%)", f"${scenarios['total'][90]:,.0f}",
+                  help=f"최근 30일: ${scenarios['recent'][90]:,.0f}")
+    
+    by_format = revenue['revenue_by_format']
+    st.caption(f"형식별 예상 광고 수익: 쇼츠 ${by_format['short']:,.0f} · 롱폼 ${by_format['long_form']:,.0f}")
     
     # Revenue breakdown chart
     st.subheader("📊 수익원별 분석")
@@ -1246,9 +1397,9 @@ def display_revenue_analysis(visualizer, channel_info):
         
         if subscriber_count < 1000:
             tips.append("• 1,000명 구독자 달성으로 수익화 시작")
-        if len([v for v in videos_data if v.get('duration_seconds', 0) > 480]) < 5:
+        if int((visualizer.df['duration_seconds'] > 480).sum()) < 5:
             tips.append("• 8분 이상 영상으로 중간 광고 삽입")
-        if monthly_views < 10000:
+        if revenue['recent_views'] < 10000:
             tips.append("• 업로드 주기 단축으로 노출 증대")
         
         if not tips:
@@ -1279,20 +1430,19 @@ def display_ai_recommendations(visualizer, channel_info):
         return
     
     # Analyze successful patterns
-    top_videos = sorted(videos_data, key=lambda x: x.get('view_count', 0), reverse=True)[:10]
+    insights = visualizer.get_insight_engine()
     
     # AI-style recommendations based on data analysis
     st.subheader("🎯 맞춤형 콘텐츠 전략")
     
     # Content type recommendation
-    shorts_performance = [v for v in top_videos if v.get('is_short', False)]
-    longform_performance = [v for v in top_videos if not v.get('is_short', False)]
+    format_advantage = insights.format_advantage()
     
     col1, col2 = st.columns(2)
     
     with col1:
         st.markdown("### 📱 최적 콘텐츠 형식")
-        if len(shorts_performance) > len(longform_performance):
+        if format_advantage['recommended'] == 'short':
             st.success("🎯 **쇼츠 콘텐츠 집중 추천**")
             st.write("• 60초 이하 임팩트 있는 콘텐츠")
             st.write("• 트렌딩 음악과 해시태그 활용")
@@ -1306,84 +1456,38 @@ def display_ai_recommendations(visualizer, channel_info):
     with col2:
         st.markdown("### ⏰ 최적 업로드 시간")
         
-        # Find best upload times
-        hour_performance = {}
-        day_performance = {}
+        # Best upload slot by average views of the top videos
+        best_slot = insights.best_upload_slot()
         
-        for video in top_videos:
-            hour = video['published_at'].hour
-            day = video['published_at'].strftime('%A')
-            
-            if hour not in hour_performance:
-                hour_performance[hour] = []
-            if day not in day_performance:
-                day_performance[day] = []
-                
-            hour_performance[hour].append(video.get('view_count', 0))
-            day_performance[day].append(video.get('view_count', 0))
-        
-        # Calculate average performance
-        best_hour = max(hour_performance.keys(), 
-                       key=lambda x: sum(hour_performance[x]) / len(hour_performance[x])) if hour_performance else 12
-        best_day = max(day_performance.keys(), 
-                      key=lambda x: sum(day_performance[x]) / len(day_performance[x])) if day_performance else "Sunday"
-        
-        day_names = {
-            'Monday': '월요일', 'Tuesday': '화요일', 'Wednesday': '수요일',
-            'Thursday': '목요일', 'Friday': '금요일', 'Saturday': '토요일', 'Sunday': '일요일'
-        }
-        
-        st.info(f"🕐 **{best_hour}시 업로드 추천**")
-        st.info(f"📅 **{day_names.get(best_day, best_day)} 업로드 추천**")
+        st.info(f"🕐 **{best_slot['hour']}시 업로드 추천**")
+        st.info(f"📅 **{DAY_NAMES_KO.get(best_slot['day'], best_slot['day'])} 업로드 추천**")
     
     # Title optimization
     st.subheader("📝 제목 최적화 AI")
     
-    # Analyze successful title patterns
-    successful_titles = [v['title'] for v in top_videos if v.get('title')]
+    # Analyze successful title patterns (same tokenizer as the keyword tab)
+    title_stats = insights.title_patterns()
     
-    if successful_titles:
-        # Common words analysis
-        from collections import Counter
-        import re
-        
-        all_words = []
-        for title in successful_titles:
-            words = re.findall(r'\b\w+\b', title.lower())
-            all_words.extend(words)
-        
-        common_words = Counter(all_words).most_common(10)
-        
+    if title_stats:
         col1, col2 = st.columns(2)
         
         with col1:
             st.write("**성공 키워드 TOP 5:**")
-            for word, count in common_words[:5]:
+            for word, count in title_stats['top_words'][:5]:
                 st.write(f"• {word} ({count}회)")
         
         with col2:
             st.write("**제목 패턴 분석:**")
-            avg_length = sum(len(title) for title in successful_titles) / len(successful_titles)
-            question_count = sum(1 for title in successful_titles if '?' in title)
-            exclamation_count = sum(1 for title in successful_titles if '!' in title)
-            
-            st.write(f"• 최적 제목 길이: {avg_length:.0f}자")
-            st.write(f"• 물음표 사용: {question_count}개 영상")
-            st.write(f"• 느낌표 사용: {exclamation_count}개 영상")
+            st.write(f"• 최적 제목 길이: {title_stats['avg_length']:.0f}자")
+            st.write(f"• 물음표 사용: {title_stats['question_count']}개 영상")
+            st.write(f"• 느낌표 사용: {title_stats['exclamation_count']}개 영상")
     
     # Content gap analysis
     st.subheader("🔍 콘텐츠 갭 분석")
     
     # Analyze upload frequency
-    if len(videos_data) >= 5:
-        recent_uploads = sorted(videos_data, key=lambda x: x['published_at'], reverse=True)[:5]
-        upload_gaps = []
-        
-        for i in range(1, len(recent_uploads)):
-            gap = (recent_uploads[i-1]['published_at'] - recent_uploads[i]['published_at']).days
-            upload_gaps.append(gap)
-        
-        avg_gap = sum(upload_gaps) / len(upload_gaps) if upload_gaps else 7
+    avg_gap = insights.gap_stats()['recent_mean_days']
+    if avg_gap is not None:
         
         col1, col2, col3 = st.columns(3)
         
@@ -1454,11 +1558,7 @@ def display_ai_recommendations(visualizer, channel_info):
     elif recommendation_type == "편집 스타일":
         st.success("✂️ 편집 스타일 개선점:")
         # Get performance data for editing recommendations
-        top_videos = sorted(videos_data, key=lambda x: x.get('view_count', 0), reverse=True)[:10]
-        shorts_performance = [v for v in top_videos if v.get('is_short', False)]
-        longform_performance = [v for v in top_videos if not v.get('is_short', False)]
-        
-        if len(shorts_performance) > len(longform_performance):
+        if format_advantage['recommended'] == 'short':
             st.write("• 빠른 컷 편집과 역동적인 트랜지션")
             st.write("• 시각적 임팩트를 위한 텍스트 오버레이")
         else:
@@ -1499,20 +1599,45 @@ def display_keywords_analysis(visualizer):
     
     with col1:
         st.subheader(f"☁️ 워드 클라우드 - { {'titles':'제목','descriptions':'설명','tags':'태그'}[analysis_source] }")
-        wordcloud_fig = visualizer.create_wordcloud(source=analysis_source)
-        if wordcloud_fig:
-            st.pyplot(wordcloud_fig, use_container_width=True)
+        wordcloud_png = visualizer.create_wordcloud(source=analysis_source)
+        if wordcloud_png:
+            st.image(wordcloud_png, use_container_width=True)
         else:
             st.info(f"{ {'titles':'제목','descriptions':'설명','tags':'태그'}[analysis_source] } 데이터가 부족하여 워드클라우드를 생성할 수 없습니다.")
 
     with col2:
         st.subheader(f"📊 주요 키워드 - { {'titles':'제목','descriptions':'설명','tags':'태그'}[analysis_source] }")
-        keywords_fig = visualizer.create_keywords_chart(source=analysis_source, top_n=20)
-        if keywords_fig:
-            st.plotly_chart(keywords_fig, use_container_width=True)
-        else:
+        if not display_chart(visualizer, 'create_keywords_chart', source=analysis_source, top_n=20):
             st.info(f"{ {'titles':'제목','descriptions':'설명','tags':'태그'}[analysis_source] } 데이터가 부족하여 키워드 분석을 할 수 없습니다.")
 
+    # 키워드 성과 표 (전체 키워드)
+    st.subheader("📋 키워드 성과 표")
+    min_support = st.slider("최소 등장 영상 수", min_value=1, max_value=20, value=3, key="keyword_min_support")
+    keyword_table = visualizer.get_keyword_performance(source=analysis_source, min_support=min_support)
+
+    if not keyword_table.empty:
+        display_table = keyword_table.rename(columns={
+            'keyword': '키워드',
+            'occurrences': '등장 횟수',
+            'video_count': '영상수',
+            'avg_views': '평균 조회수',
+            'median_views': '중간 조회수',
+            'avg_engagement': '평균 참여율 (%)',
+            'lift': '채널 평균 대비'
+        })
+        st.dataframe(
+            display_table,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                '평균 조회수': st.column_config.NumberColumn(format="%d"),
+                '중간 조회수': st.column_config.NumberColumn(format="%d"),
+                '평균 참여율 (%)': st.column_config.NumberColumn(format="%.2f"),
+                '채널 평균 대비': st.column_config.NumberColumn(format="%.2fx")
+            }
+        )
+    else:
+        st.info("조건을 만족하는 키워드가 없습니다.")
 
     # 성공 영상 패턴
     st.subheader("🎯 성공 영상 패턴")
@@ -1531,14 +1656,13 @@ def display_keywords_analysis(visualizer):
             st.subheader("📈 최적 업로드 시간")
             if patterns.get('best_times'):
                 for time_info in patterns['best_times']:
-                    st.write(f"**{time_info['period']}**: 평균 {time_info['avg_views']:,.0f}회 ({time_info['count']}개 영상)")
+                    st.write(f"**{time_info['period']}**: 보정 평균 {time_info['avg_views']:,.0f}회 ({time_info['count']}개 영상)")
 
-def display_detailed_data():
-    """Display detailed video data with filtering and sorting"""
+def display_detailed_data(visualizer):
+    """Display detailed video data with filtering, sorting and pagination"""
     st.subheader("📊 상세 영상 데이터")
     
-    videos_data = st.session_state.channel_data['videos']
-    df = pd.DataFrame(videos_data)
+    table = visualizer.get_video_table()
     
     # Filters
     col1, col2, col3 = st.columns(3)
@@ -1565,23 +1689,66 @@ def display_detailed_data():
             key="date_filter"
         )
     
-    # Apply filters
-    filtered_df = df.copy()
+    # Search functionality
+    col1, col2 = st.columns([3, 1])
     
-    if video_type_filter != "All":
-        is_short = video_type_filter == "Shorts"
-        filtered_df = filtered_df[filtered_df['is_short'] == is_short]
+    with col1:
+        search_term = st.text_input(
+            "🔍 제목 내 검색",
+            key="search_filter",
+            help="입력한 단어가 모두 포함된 영상을 찾습니다 (띄어쓰기로 구분)"
+        )
     
-    if min_views > 0:
-        filtered_df = filtered_df[filtered_df['view_count'] >= min_views]
+    with col2:
+        st.write("")
+        search_all_fields = st.checkbox("설명·태그 포함", key="search_all_fields")
     
-    # Search functionality
-    search_term = st.text_input("🔍 제목 내 검색", key="search_filter")
-    if search_term:
-        filtered_df = filtered_df[filtered_df['title'].str.contains(search_term, case=False, na=False)]
+    search_fields = ('title', 'description', 'tags') if search_all_fields else ('title',)
     
-    # Display filtered data
-    st.write(f"Showing {len(filtered_df)} of {len(df)} videos")
+    # Sorting
+    sort_options = {
+        'published_at': '업로드일',
+        'view_count': '조회수',
+        'like_count': '좋아요',
+        'comment_count': '댓글수'
+    }
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        sort_by = st.selectbox(
+            "정렬 기준",
+            list(sort_options),
+            format_func=lambda column: sort_options[column],
+            key="detail_sort_by"
+        )
+    
+    with col2:
+        sort_order = st.selectbox("정렬 순서", ["내림차순", "오름차순"], key="detail_sort_order")
+    
+    with col3:
+        page_size = st.selectbox("페이지당 영상 수", [25, 50, 100], index=1, key="detail_page_size")
+    
+    # Filtering and sorting run on the table's presorted indexes
+    video_type = {"쇼츠": True, "롱폼": False}.get(video_type_filter)
+    rows = table.query(
+        video_type=video_type,
+        min_views=int(min_views),
+        date_range=tuple(date_range),
+        search=search_term.strip() or None,
+        sort_by=sort_by,
+        descending=sort_order == "내림차순",
+        search_fields=search_fields
+    )
+    
+    # Go back to the first page whenever the result set changes
+    query_signature = (st.session_state.dataset_version, video_type, int(min_views), tuple(date_range),
+                       search_term, search_fields, sort_by, sort_order, page_size)
+    if st.session_state.get("detail_query_signature") != query_signature:
+        st.session_state.detail_query_signature = query_signature
+        st.session_state.detail_page = 1
+    
+    page_count = table.page_count(rows, page_size)
+    st.session_state.detail_page = min(st.session_state.get("detail_page", 1), page_count)
     
     # Select columns to display
     available_columns = ['title', 'published_at', 'view_count', 'like_count', 'comment_count', 
@@ -1593,8 +1760,24 @@ def display_detailed_data():
         key="column_selector"
     )
     
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        page_number = st.number_input(
+            "페이지",
+            min_value=1,
+            max_value=page_count,
+            step=1,
+            key="detail_page"
+        )
+    
+    with col2:
+        st.write("")
+        st.write(f"전체 {table.n_rows:,}개 중 {len(rows):,}개 영상 · {page_number}/{page_count} 페이지")
+    
     if selected_columns:
-        display_df = filtered_df[selected_columns].copy()
+        # Only the visible page is materialized and sent to the browser
+        display_df = table.page(rows, page_number, page_size, selected_columns)
         
         # Format column names
         column_mapping = {
@@ -1608,10 +1791,10 @@ def display_detailed_data():
             'tags': '태그'
         }
         
-        display_df = display_df.rename(columns=column_mapping)
+        if 'is_short' in display_df.columns:
+            display_df['is_short'] = display_df['is_short'].map({True: '쇼츠', False: '롱폼'})
         
-        if 'Type' in display_df.columns:
-            display_df['Type'] = display_df['Type'].map({True: 'Shorts', False: 'Long-form'})
+        display_df = display_df.rename(columns=column_mapping)
         
         st.dataframe(
             display_df,
@@ -1670,6 +1853,26 @@ def display_export_options(visualizer):
             else:
                 st.markdown(f"**{key}:** {value}")
         
+        # Chart payload metrics for this dataset
+        with st.expander("⚡ 차트 페이로드 통계"):
+            payload_stats = visualizer.figure_payload_stats()
+            if payload_stats.empty:
+                st.caption("아직 렌더링된 차트가 없습니다.")
+            else:
+                st.caption(f"캐시된 차트 {len(payload_stats)}개 · 총 {payload_stats['kb'].sum():,.1f} KB")
+                st.dataframe(
+                    payload_stats.rename(columns={
+                        'chart': '차트',
+                        'params': '옵션',
+                        'traces': '트레이스',
+                        'kb': '크기 (KB)',
+                        'build_ms': '생성 (ms)',
+                        'serialize_ms': '직렬화 (ms)'
+                    }),
+                    use_container_width=True,
+                    hide_index=True
+                )
+        
         # Export summary as text
         summary_text = "\n".join([f"{k}: {v}" for k, v in summary.items()])
         st.download_button(
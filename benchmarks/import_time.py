@@ -0,0 +1,106 @@
+"""
+Import-time benchmark for the dashboard modules
+
+Each module is imported in a fresh interpreter with `python -X importtime`
+and the cumulative import time plus the heaviest direct imports are reported.
+Modules that exceed their budget make the script exit with status 1, so it
+can be used as a cold-start regression check.
+
+Usage:
+    python benchmarks/import_time.py [--top 8] [--runs 3] [module ...]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cumulative import time budgets (ms), best of --runs
+IMPORT_BUDGETS_MS = {
+    'text_tokenizer': 50,
+    'url_parser': 50,
+    'youtube_analyzer': 100,
+    'data_visualizer': 700,
+    'app': 1300
+}
+
+
+def measure_import(module):
+    """
+    Import a module in a fresh interpreter
+
+    Returns the module's cumulative import time (us) and a list of
+    (name, cumulative_us) for its direct imports.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True
+    )
+
+    # Entries are printed in post-order; indentation encodes nesting depth
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        try:
+            _, cumulative_us, raw_name = line[len('import time:'):].split('|', 2)
+        except ValueError:
+            continue
+        name = raw_name.strip()
+        depth = (len(raw_name) - len(raw_name.lstrip()) - 1) // 2
+        entries.append((name, depth, int(cumulative_us)))
+
+    module_index = next(
+        (i for i, (name, depth, _) in enumerate(entries) if name == module and depth == 0),
+        None
+    )
+    if result.returncode != 0 or module_index is None:
+        raise RuntimeError(f"Failed to import {module}: {result.stderr.strip().splitlines()[-1:]}")
+
+    # Direct imports are the depth-1 entries in the module's contiguous subtree
+    direct_imports = []
+    for name, depth, cumulative_us in reversed(entries[:module_index]):
+        if depth == 0:
+            break
+        if depth == 1:
+            direct_imports.append((name, cumulative_us))
+
+    return entries[module_index][2], direct_imports
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold import time of the dashboard modules")
+    parser.add_argument('modules', nargs='*', default=list(IMPORT_BUDGETS_MS))
+    parser.add_argument('--top', type=int, default=8, help="number of heaviest direct imports to show")
+    parser.add_argument('--runs', type=int, default=3, help="fresh interpreters per module (best run is kept)")
+    args = parser.parse_args()
+
+    over_budget = []
+
+    for module in args.modules:
+        runs = [measure_import(module) for _ in range(max(args.runs, 1))]
+        total_us, direct_imports = min(runs, key=lambda run: run[0])
+        total_ms = total_us / 1000
+        budget = IMPORT_BUDGETS_MS.get(module)
+
+        status = ''
+        if budget is not None:
+            status = 'OK' if total_ms <= budget else f'OVER BUDGET ({budget} ms)'
+            if total_ms > budget:
+                over_budget.append(module)
+
+        print(f"{module}: {total_ms:,.1f} ms {status}")
+
+        # Heaviest direct imports of the module
+        heaviest = sorted(direct_imports, key=lambda item: item[1], reverse=True)
+        for name, cumulative in heaviest[:args.top]:
+            print(f"    {cumulative / 1000:>9,.1f} ms  {name}")
+
+    return 1 if over_budget else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
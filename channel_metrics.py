@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+
+COUNT_COLUMNS = ['view_count', 'like_count', 'comment_count']
+
+
+def compute_channel_metrics(df):
+    """
+    Compute all results-header KPIs in one vectorized pass over the columnar data
+    """
+    total_videos = len(df)
+    if total_videos == 0:
+        return {
+            'total_videos': 0,
+            'total_views': 0,
+            'total_likes': 0,
+            'total_comments': 0,
+            'avg_views': 0,
+            'shorts_count': 0,
+            'long_form_count': 0,
+            'avg_engagement_rate': 0,
+            'upload_frequency_days': None,
+            'best_video_views': 0,
+            'first_upload': None,
+            'last_upload': None
+        }
+
+    counts = df.reindex(columns=COUNT_COLUMNS).fillna(0).to_numpy(dtype=np.int64)
+    total_views, total_likes, total_comments = (int(x) for x in counts.sum(axis=0))
+    best_row = int(counts[:, 0].argmax())
+
+    shorts_count = int(df['is_short'].fillna(False).astype(bool).to_numpy().sum()) if 'is_short' in df.columns else 0
+
+    published = pd.to_datetime(df['published_at'])
+    first_upload = published.min()
+    last_upload = published.max()
+
+    upload_frequency_days = None
+    if total_videos > 1:
+        date_range = (last_upload - first_upload).days
+        upload_frequency_days = date_range / total_videos if date_range > 0 else 0
+
+    return {
+        'total_videos': total_videos,
+        'total_views': total_views,
+        'total_likes': total_likes,
+        'total_comments': total_comments,
+        'avg_views': total_views / total_videos,
+        'shorts_count': shorts_count,
+        'long_form_count': total_videos - shorts_count,
+        'avg_engagement_rate': (total_likes + total_comments) / total_views * 100 if total_views > 0 else 0,
+        'upload_frequency_days': upload_frequency_days,
+        'best_video_views': int(counts[best_row, 0]),
+        'first_upload': first_upload,
+        'last_upload': last_upload
+    }
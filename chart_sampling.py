@@ -0,0 +1,84 @@
+import numpy as np
+
+# Above this many points scatter charts switch to WebGL (Scattergl) traces
+WEBGL_POINT_THRESHOLD = 2000
+# Scatter charts are decimated down to about this many points
+MAX_SCATTER_POINTS = 4000
+# Points further than this many robust standard deviations from the median are always kept
+OUTLIER_MAD_THRESHOLD = 3.5
+# Titles are truncated to this many characters in hover labels
+HOVER_TITLE_LENGTH = 40
+
+
+def _grid_coordinate(values, bins, log_scale):
+    """Bin values into equal-width (or equal log-width) buckets"""
+    values = np.asarray(values, dtype=float)
+    if log_scale:
+        values = np.log10(np.clip(values, 0, None) + 1)
+    values = np.nan_to_num(values)
+
+    low, high = values.min(), values.max()
+    if high <= low:
+        return np.zeros(len(values), dtype=np.int64)
+    return np.minimum(((values - low) / (high - low) * bins).astype(np.int64), bins - 1)
+
+
+def outlier_mask(values, threshold=OUTLIER_MAD_THRESHOLD, log_scale=True):
+    """Flag values far from the median in median-absolute-deviation units"""
+    values = np.asarray(values, dtype=float)
+    if log_scale:
+        values = np.log10(np.clip(values, 0, None) + 1)
+    values = np.nan_to_num(values)
+    if not len(values):
+        return np.zeros(0, dtype=bool)
+
+    median = np.median(values)
+    mad = np.median(np.abs(values - median)) * 1.4826
+    if mad == 0:
+        return values != median
+    return np.abs(values - median) > threshold * mad
+
+
+def decimate_points(x, y, max_points=MAX_SCATTER_POINTS, bins=48, log_x=True, log_y=True, seed=0):
+    """
+    Pick at most about max_points row positions that preserve the shape of a scatter
+
+    Points are bucketed on a bins x bins grid and every bucket keeps up to the
+    same quota of points, so sparse regions stay fully represented while dense
+    clusters are thinned. Outliers on either axis are always kept. Returns
+    sorted row positions.
+    """
+    n_points = len(x)
+    if n_points <= max_points:
+        return np.arange(n_points)
+
+    cell = _grid_coordinate(x, bins, log_x) * bins + _grid_coordinate(y, bins, log_y)
+    counts = np.bincount(cell, minlength=bins * bins)
+
+    # Largest per-cell quota that keeps the total within budget (binary search)
+    low, high = 1, int(counts.max())
+    while low < high:
+        quota = (low + high + 1) // 2
+        if np.minimum(counts, quota).sum() <= max_points:
+            low = quota
+        else:
+            high = quota - 1
+    quota = low
+
+    # Random rank within each cell (deterministic), keep ranks below the quota
+    order = np.lexsort((np.random.default_rng(seed).random(n_points), cell))
+    starts = np.concatenate(([0], np.cumsum(counts)))[cell[order]]
+    rank = np.arange(n_points) - starts
+    keep = np.zeros(n_points, dtype=bool)
+    keep[order[rank < quota]] = True
+
+    keep |= outlier_mask(x, log_scale=log_x) | outlier_mask(y, log_scale=log_y)
+    return np.flatnonzero(keep)
+
+
+def truncate_titles(titles, length=HOVER_TITLE_LENGTH):
+    """Shorten titles for hover labels"""
+    return [
+        title if len(title) <= length else title[:length - 1] + '…'
+        for title in (t if isinstance(t, str) else '' for t in titles)
+    ]
@@ -0,0 +1,189 @@
+import threading
+import time
+
+from progress_bus import ProgressEventBus
+from shared_cache import channel_datasets
+
+# Finished jobs nobody picked up (e.g. closed browser tabs) are dropped after this many seconds
+FINISHED_JOB_TTL_SECONDS = 30 * 60
+
+
+class CollectionJob:
+    """
+    Runs YouTubeAnalyzer.collect_all_videos in a background thread
+
+    Identical collections (same channel and options) are coalesced through
+    the shared dataset cache: a job that finds another session already
+    collecting the same data follows that job instead of calling the API.
+    """
+
+    def __init__(self, analyzer, channel_data, options, progress_bus=None, result_cache=channel_datasets):
+        self.analyzer = analyzer
+        self.channel_data = channel_data
+        self.options = dict(options)
+        self.progress_bus = progress_bus or ProgressEventBus()
+        self.result_cache = result_cache
+        self.leader = None
+
+        self.state = 'pending'
+        self.result = None
+        self.error = None
+        self.started_at = None
+        self.finished_at = None
+
+        self._videos = []
+        self._lock = threading.Lock()
+        self._cancel_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"collect-{channel_data.get('id', 'channel')}",
+            daemon=True
+        )
+
+    def start(self):
+        """Start collecting in the background"""
+        self.state = 'running'
+        self.started_at = time.time()
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        """Ask the worker to stop after the current page of videos"""
+        self._cancel_event.set()
+
+    def is_running(self):
+        """Whether the worker thread is still collecting"""
+        return self.state in ('pending', 'running')
+
+    def is_cancelled(self):
+        """Whether cancellation has been requested"""
+        return self._cancel_event.is_set()
+
+    def cache_key(self):
+        """Key identifying identical collections in the shared dataset cache"""
+        return (
+            self.channel_data['id'],
+            self.options.get('max_results'),
+            self.options.get('include_shorts', True),
+            self.options.get('include_long_form', True)
+        )
+
+    def latest_progress(self):
+        """Latest progress snapshot (the leader's while following another job)"""
+        leader = self.leader
+        if leader is not None:
+            return leader.latest_progress()
+        return self.progress_bus.latest
+
+    def partial_videos(self):
+        """Return a snapshot of the videos collected so far"""
+        leader = self.leader
+        if leader is not None:
+            return leader.partial_videos()
+        with self._lock:
+            return list(self._videos)
+
+    def collected_count(self):
+        """Number of videos collected so far"""
+        leader = self.leader
+        if leader is not None:
+            return leader.collected_count()
+        with self._lock:
+            return len(self._videos)
+
+    def _add_video(self, video):
+        """Collect a video as soon as the worker has it"""
+        with self._lock:
+            self._videos.append(video)
+
+    def _progress(self, current, total, message):
+        """Forward worker progress to the event bus"""
+        self.progress_bus.publish(current, total, message, api_calls=self.analyzer.api_calls)
+
+    def _follow(self, leader):
+        """Mirror another job's progress while waiting for its result"""
+        if leader is not self:
+            self.leader = leader
+
+    def _collect(self):
+        """Collect videos through the API (only the leader for a key does this)"""
+        self.leader = None
+        return self.analyzer.collect_all_videos(
+            self.channel_data['id'],
+            progress_callback=self._progress,
+            cancel_event=self._cancel_event,
+            video_callback=self._add_video,
+            **self.options
+        )
+
+    def _run(self):
+        try:
+            if self.result_cache is None:
+                self.result = self._collect()
+            else:
+                # Cancelled collections are partial and must not be shared
+                result = self.result_cache.get_or_compute(
+                    self.cache_key(),
+                    self._collect,
+                    owner=self,
+                    on_wait=self._follow,
+                    is_complete=lambda videos: not self._cancel_event.is_set(),
+                    cancel_event=self._cancel_event
+                )
+                if result is None and self.leader is not None:
+                    # Cancelled while following: keep what the leader has so far
+                    result = self.leader.partial_videos()
+                self.result = result
+            self.leader = None
+            self.state = 'cancelled' if self._cancel_event.is_set() else 'done'
+        except Exception as e:
+            self.error = str(e)
+            self.state = 'error'
+        finally:
+            self.progress_bus.flush()
+            self.finished_at = time.time()
+
+
+class CollectionJobRegistry:
+    """Process-wide registry of background collection jobs, keyed by session"""
+
+    def __init__(self, finished_ttl=FINISHED_JOB_TTL_SECONDS):
+        self.finished_ttl = finished_ttl
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def get(self, session_key):
+        """Return the session's job, if any"""
+        with self._lock:
+            return self._jobs.get(session_key)
+
+    def submit(self, session_key, job):
+        """Start a job for a session, cancelling the one it replaces"""
+        with self._lock:
+            self._prune()
+            previous = self._jobs.get(session_key)
+            self._jobs[session_key] = job
+
+        if previous is not None and previous.is_running():
+            previous.cancel()
+
+        return job.start()
+
+    def pop(self, session_key):
+        """Remove and return the session's job"""
+        with self._lock:
+            return self._jobs.pop(session_key, None)
+
+    def _prune(self):
+        """Drop finished jobs that were never picked up"""
+        now = time.time()
+        expired = [
+            key for key, job in self._jobs.items()
+            if job.finished_at is not None and now - job.finished_at > self.finished_ttl
+        ]
+        for key in expired:
+            del self._jobs[key]
+
+
+# Shared registry used by the Streamlit app
+collection_jobs = CollectionJobRegistry()
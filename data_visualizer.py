@@ -1,86 +1,123 @@
 import pandas as pd
-import matplotlib
-import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
-from wordcloud import WordCloud
-import numpy as np
 from datetime import datetime, timedelta
 from collections import Counter
-import seaborn as sns
 import io
-import base64
+import os
+import time
+import functools
+import inspect
+import threading
 
-from matplotlib import font_manager, rc
+import numpy as np
 
-# 1. 폰트 경로 (상대경로 기준)
-font_path = "./font/BlackHanSans-Regular.ttf"   # or "font/BlackHanSans-Regular.ttf"
+from analysis_cache import cached_results, memoized
+from chart_sampling import WEBGL_POINT_THRESHOLD, decimate_points, truncate_titles
+from histogram_bins import DEFAULT_BIN_COUNT, histogram_bins
+from channel_metrics import compute_channel_metrics
+from figure_cache import FigurePayload
+from keyword_index import KeywordIndex
+from insight_engine import InsightEngine
+from outlier_engine import OUTLIER_METRIC, OVERPERFORMER_Z, OutlierEngine
+from rank_index import RankIndex
+from revenue_engine import RevenueEngine
+from time_cube import WEEKDAY_NAMES, TimeBucketCube
+from time_features import DEFAULT_DISPLAY_TIMEZONE, add_time_features
+from trend_engine import TrendEngine
+from video_table import VideoTable
+from text_tokenizer import default_tokenizer
 
-# 2. 폰트 이름 얻기
-font_name = font_manager.FontProperties(fname=font_path).get_name()
+# plotly.express, plotly.subplots, wordcloud and PIL are imported on first use
+# to keep worker cold start fast (see benchmarks/import_time.py)
 
-# 3. matplotlib 전역 폰트 적용
-plt.rc('font', family=font_name)
+# 폰트 경로 (모듈 기준 절대경로)
+font_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'font', 'BlackHanSans-Regular.ttf')
 
-# (워드클라우드 등에서 바로 반영)
+@functools.lru_cache(maxsize=1)
+def get_wordcloud_font_path():
+    """Resolve and validate the word cloud font once per process, on first use"""
+    from PIL import ImageFont
+    
+    try:
+        ImageFont.truetype(font_path)
+        return font_path
+    except OSError as e:
+        print(f"Error loading word cloud font: {e}")
+        return None
 
 class DataVisualizer:
     """Comprehensive data visualization for YouTube channel analysis"""
     
-    def __init__(self, videos_data):
+    def __init__(self, videos_data, timezone=DEFAULT_DISPLAY_TIMEZONE, frame=None):
         self.videos_data = videos_data
-        self.df = pd.DataFrame(videos_data)
-        
-        # Ensure datetime columns
-        if not self.df.empty:
-            self.df['published_at'] = pd.to_datetime(self.df['published_at'])
+        self.timezone = timezone
+        # frame reuses an already built DataFrame of videos_data (see with_timezone)
+        self.df = frame.copy() if frame is not None else pd.DataFrame(videos_data)
+        self._keyword_indexes = {}
+        self._time_cube = None
+        self._trend_engine = None
+        self._revenue_engine = None
+        self._rank_index = None
+        self._insight_engine = None
+        self._outlier_engine = None
+        self._video_table = None
+        self._channel_metrics = None
+        # Guards the lazily built per-dataset structures when charts are built concurrently
+        self._build_lock = threading.Lock()
+        
+        # Timestamps and derived time features in the display timezone
+        add_time_features(self.df, timezone)
     
-    def create_views_distribution(self):
-        """Create views distribution histogram"""
+    def with_timezone(self, timezone):
+        """
+        Visualizer for the same dataset shown in another timezone
+        
+        Reuses this DataFrame and the timezone-independent revenue engine, so
+        only the time features and time-bucketed structures are recomputed.
+        """
+        visualizer = DataVisualizer(self.videos_data, timezone, frame=self.df)
+        visualizer._revenue_engine = self.get_revenue_engine()
+        return visualizer
+    
+    @memoized
+    def create_views_distribution(self, log_scale=True):
+        """Create views distribution histogram (binned server-side)"""
         if self.df.empty:
             return self._create_empty_chart("데이터가 없습니다")
         
-        fig = px.histogram(
-            self.df,
-            x='view_count',
-            nbins=30,
-            title='조회수 분포',
-            labels={'view_count': '조회수', 'count': '영상 수'},
-            color_discrete_sequence=['#FF0000']
+        fig = self._create_binned_histogram(
+            self.df['view_count'],
+            title='조회수 분포 (로그 스케일)' if log_scale else '조회수 분포',
+            label='조회수',
+            log_scale=log_scale,
+            color='#FF0000'
         )
         
         fig.update_layout(
             showlegend=False,
             height=400,
-            xaxis_tickformat=',',
-            hovermode='x unified',
             font=dict(family="Noto Sans KR, sans-serif"),
             title_font=dict(size=16, family="Noto Sans KR, sans-serif")
         )
         
         return fig
     
+    @memoized
     def create_engagement_chart(self):
         """Create engagement rate distribution"""
         if self.df.empty:
             return self._create_empty_chart("데이터가 없습니다")
         
-        fig = px.scatter(
-            self.df,
+        fig = self._create_type_scatter(
             x='view_count',
             y='engagement_rate',
-            color='is_short',
-            size='like_count',
-            hover_data=['title', 'published_at'],
             title='참여율 vs 조회수',
             labels={
                 'view_count': '조회수',
-                'engagement_rate': '참여율 (%)',
-                'is_short': '영상 유형'
+                'engagement_rate': '참여율 (%)'
             },
-            color_discrete_map={True: '#FF6B6B', False: '#4ECDC4'}
+            hover_column='published_at',
+            log_y=False
         )
         
         fig.update_layout(
@@ -90,13 +127,13 @@ class DataVisualizer:
             title_font=dict(size=16, family="Noto Sans KR, sans-serif"),
             legend=dict(title="영상 유형")
         )
-        
-        # Update legend labels
-        fig.for_each_trace(lambda t: t.update(name="쇼츠" if t.name == "True" else "롱폼"))
         return fig
     
+    @memoized
     def create_shorts_vs_longform_comparison(self):
         """Compare performance between Shorts and Long-form videos"""
+        from plotly.subplots import make_subplots
+        
         if self.df.empty:
             return self._create_empty_chart("No data available")
         
@@ -153,25 +190,21 @@ class DataVisualizer:
         
         return fig
     
+    @memoized
     def create_duration_views_correlation(self):
         """Create scatter plot showing duration vs views correlation"""
         if self.df.empty:
             return self._create_empty_chart("No data available")
         
-        fig = px.scatter(
-            self.df,
+        fig = self._create_type_scatter(
             x='duration_seconds',
             y='view_count',
-            color='is_short',
-            size='like_count',
-            hover_data=['title', 'duration_formatted'],
             title='영상 길이 vs 조회수',
             labels={
                 'duration_seconds': '영상 길이 (초)',
-                'view_count': '조회수',
-                'is_short': '영상 유형'
+                'view_count': '조회수'
             },
-            color_discrete_map={True: '#FF6B6B', False: '#4ECDC4'}
+            hover_column='duration_formatted'
         )
         
         fig.update_layout(
@@ -179,27 +212,23 @@ class DataVisualizer:
             xaxis_tickformat=',', 
             yaxis_tickformat=',',
             font=dict(family="Noto Sans KR, sans-serif"),
-            title_font=dict(size=16, family="Noto Sans KR, sans-serif")
+            title_font=dict(size=16, family="Noto Sans KR, sans-serif"),
+            legend=dict(title="영상 유형")
         )
         return fig
     
+    @memoized
     def create_monthly_trends(self):
         """Create monthly upload and performance trends"""
+        from plotly.subplots import make_subplots
+        
         if self.df.empty:
             return self._create_empty_chart("No data available")
         
-        # Group by month and video type
-        monthly_data = self.df.groupby([
-            self.df['published_at'].dt.to_period('M'),
-            'is_short'
-        ]).agg({
-            'video_id': 'count',
-            'view_count': 'mean',
-            'like_count': 'mean',
-            'engagement_rate': 'mean'
-        }).reset_index()
-        
-        monthly_data['month_str'] = monthly_data['published_at'].astype(str)
+        # Monthly aggregates by video type from the shared time cube
+        monthly_data = self.get_time_cube().by_month()
+        
+        monthly_data['month_str'] = monthly_data['month']
         monthly_data['video_type'] = monthly_data['is_short'].apply(lambda x: '쇼츠' if x else '롱폼')
         
         # Create subplot with uploads and average views
@@ -217,7 +246,7 @@ class DataVisualizer:
             fig.add_trace(
                 go.Scatter(
                     x=data['month_str'],
-                    y=data['video_id'],
+                    y=data['count'],
                     mode='lines+markers',
                     name=f'{video_type} - Uploads',
                     line=dict(color=color),
@@ -230,7 +259,7 @@ class DataVisualizer:
             fig.add_trace(
                 go.Scatter(
                     x=data['month_str'],
-                    y=data['view_count'],
+                    y=data['view_count_mean'],
                     mode='lines+markers',
                     name=f'{video_type} - Avg Views',
                     line=dict(color=color, dash='dash'),
@@ -251,28 +280,86 @@ class DataVisualizer:
         
         return fig
     
+    @memoized
+    def create_views_forecast_chart(self, horizon=3):
+        """Create monthly views with a robust trend forecast and prediction interval"""
+        engine = self.get_trend_engine()
+        series = engine.monthly_series('view_count')
+        forecast = engine.forecast('view_count', horizon=horizon)
+        
+        if series.empty:
+            return self._create_empty_chart("데이터가 없습니다")
+        
+        settled = series[series['settled']]
+        unsettled = series.iloc[max(len(settled) - 1, 0):]
+        
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(
+            x=settled['month'],
+            y=settled['total'],
+            mode='lines+markers',
+            name='월별 조회수',
+            line=dict(color='#FF0000')
+        ))
+        # Recent months are still collecting views; shown apart from the trend
+        fig.add_trace(go.Scatter(
+            x=unsettled['month'],
+            y=unsettled['total'],
+            mode='lines+markers',
+            name='집계 중',
+            line=dict(color='#FF0000', dash='dot'),
+            opacity=0.5
+        ))
+        
+        if not forecast.empty and not settled.empty:
+            # Connect the forecast to the last settled month
+            months = [settled['month'].iloc[-1]] + list(forecast['month'])
+            last_total = settled['total'].iloc[-1]
+            
+            fig.add_trace(go.Scatter(
+                x=months + months[::-1],
+                y=[last_total] + list(forecast['upper']) + list(forecast['lower'])[::-1] + [last_total],
+                fill='toself',
+                fillcolor='rgba(78, 205, 196, 0.2)',
+                line=dict(width=0),
+                hoverinfo='skip',
+                name='80% 예측 구간'
+            ))
+            fig.add_trace(go.Scatter(
+                x=months,
+                y=[last_total] + list(forecast['forecast']),
+                mode='lines+markers',
+                name='예측',
+                line=dict(color='#4ECDC4', dash='dash')
+            ))
+        
+        fig.update_layout(
+            title='월별 조회수 추이 및 예측',
+            xaxis_title='월',
+            yaxis_title='조회수',
+            yaxis_tickformat=',',
+            height=400,
+            font=dict(family="Noto Sans KR, sans-serif"),
+            title_font=dict(size=16, family="Noto Sans KR, sans-serif")
+        )
+        
+        return fig
+    
+    @memoized
     def create_weekday_analysis(self):
         """Analyze upload patterns by day of week"""
         if self.df.empty:
             return self._create_empty_chart("No data available")
         
-        weekday_data = self.df.groupby('day_of_week').agg({
-            'video_id': 'count',
-            'view_count': 'mean',
-            'engagement_rate': 'mean'
-        }).reset_index()
-        
-        # Order by weekday
-        weekday_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        weekday_data['day_of_week'] = pd.Categorical(weekday_data['day_of_week'], categories=weekday_order, ordered=True)
-        weekday_data = weekday_data.sort_values('day_of_week')
+        # Weekday aggregates from the shared time cube (already Monday first)
+        weekday_data = self.get_time_cube().by_weekday()
         
         fig = go.Figure()
         
         # Upload count bars
         fig.add_trace(go.Bar(
             x=weekday_data['day_of_week'],
-            y=weekday_data['video_id'],
+            y=weekday_data['count'],
             name='Upload Count',
             marker_color='#FF0000',
             yaxis='y1'
@@ -281,7 +368,7 @@ class DataVisualizer:
         # Average views line
         fig.add_trace(go.Scatter(
             x=weekday_data['day_of_week'],
-            y=weekday_data['view_count'],
+            y=weekday_data['view_count_mean'],
             mode='lines+markers',
             name='Avg Views',
             line=dict(color='#4ECDC4', width=3),
@@ -299,28 +386,64 @@ class DataVisualizer:
         
         return fig
     
+    @memoized
     def create_hourly_analysis(self):
         """Analyze upload patterns by hour of day"""
+        import plotly.express as px
+        
         if self.df.empty:
             return self._create_empty_chart("No data available")
         
-        hourly_data = self.df.groupby('hour_of_day').agg({
-            'video_id': 'count',
-            'view_count': 'mean'
-        }).reset_index()
+        hourly_data = self.get_time_cube().by_hour()
         
         fig = px.bar(
             hourly_data,
             x='hour_of_day',
-            y='video_id',
+            y='count',
             title='Upload Pattern by Hour of Day',
-            labels={'hour_of_day': 'Hour (24h format)', 'video_id': 'Upload Count'},
+            labels={'hour_of_day': 'Hour (24h format)', 'count': 'Upload Count'},
             color_discrete_sequence=['#FF0000']
         )
         
         fig.update_layout(height=400, showlegend=False)
         return fig
     
+    @memoized
+    def get_slot_matrix(self):
+        """7 x 24 weekday x hour counts and view / engagement statistics over all videos"""
+        if self.df.empty:
+            return {}
+        return self.get_time_cube().slot_matrix(self.df)
+    
+    @memoized
+    def create_upload_heatmap(self, metric='view_count', statistic='shrunk'):
+        """Weekday x hour heatmap of a slot statistic ('shrunk', 'mean' or 'median')"""
+        if self.df.empty:
+            return self._create_empty_chart("No data available")
+        
+        slots = self.get_slot_matrix()
+        values = slots[f'{metric}_{statistic}']
+        label = {'view_count': 'Views', 'engagement_rate': 'Engagement (%)'}.get(metric, metric)
+        
+        fig = go.Figure(go.Heatmap(
+            z=values,
+            x=list(range(24)),
+            y=WEEKDAY_NAMES,
+            customdata=slots['count'],
+            colorscale='Reds',
+            colorbar=dict(title=label),
+            hovertemplate='%{y} %{x}:00<br>' + label + ': %{z:,.1f}<br>Videos: %{customdata}<extra></extra>'
+        ))
+        
+        fig.update_layout(
+            title=f'{label} by Upload Slot ({statistic})',
+            xaxis=dict(title='Hour (24h format)', dtick=2),
+            yaxis=dict(title='Day of Week', autorange='reversed'),
+            height=400
+        )
+        return fig
+    
+    @memoized
     def analyze_upload_consistency(self):
         """Analyze upload consistency and patterns"""
         if self.df.empty:
@@ -329,6 +452,7 @@ class DataVisualizer:
         # Calculate days between uploads
         sorted_dates = self.df['published_at'].sort_values()
         upload_gaps = sorted_dates.diff().dt.days.dropna()
+        most_active_day, most_active_hour = self._most_active_slot()
         
         consistency_metrics = {
             "total_videos": len(self.df),
@@ -343,34 +467,42 @@ class DataVisualizer:
                 "most_consistent_gap": round(upload_gaps.mode().iloc[0] if not upload_gaps.mode().empty else 0, 2)
             },
             "upload_patterns": {
-                "most_active_day": self.df['day_of_week'].mode().iloc[0] if not self.df['day_of_week'].mode().empty else "N/A",
-                "most_active_hour": int(self.df['hour_of_day'].mode().iloc[0]) if not self.df['hour_of_day'].mode().empty else "N/A",
+                "most_active_day": most_active_day,
+                "most_active_hour": most_active_hour,
                 "uploads_per_week": round(len(self.df) / ((sorted_dates.max() - sorted_dates.min()).days / 7), 2)
             }
         }
         
         return consistency_metrics
     
+    @memoized
     def get_top_videos(self, metric='view_count', count=20):
         """Get top performing videos by specified metric"""
         if self.df.empty:
             return []
         
-        if metric not in self.df.columns:
+        if metric not in self.df.columns and metric != OUTLIER_METRIC:
+            return []
+        
+        # Unscorable datasets score every video 0, which would rank by row order
+        if metric == OUTLIER_METRIC and not self.get_outlier_engine().can_score:
             return []
         
-        top_videos = self.df.nlargest(count, metric).to_dict('records')
-        return top_videos
+        return self._top_rows(metric, count).to_dict('records')
     
+    @memoized
     def create_top_videos_chart(self, metric='view_count', count=10):
         """Create bar chart of top videos"""
+        import plotly.express as px
+        
         if self.df.empty:
             return self._create_empty_chart("No data available")
         
-        top_videos = self.df.nlargest(count, metric)
+        if metric == OUTLIER_METRIC and not self.get_outlier_engine().can_score:
+            return self._create_empty_chart("Not enough videos to score outliers")
         
         # Truncate long titles for display
-        top_videos = top_videos.copy()
+        top_videos = self._top_rows(metric, count).copy()
         top_videos['short_title'] = top_videos['title'].apply(lambda x: x[:50] + '...' if len(x) > 50 else x)
         
         fig = px.bar(
@@ -392,93 +524,63 @@ class DataVisualizer:
         
         return fig
     
-    def create_wordcloud(self, source='titles', max_words=100):
-        """Create word cloud from video titles, descriptions, or tags"""
-        if self.df.empty:
-            return None
+    @memoized
+    def create_wordcloud(self, source='titles', max_words=100, width=800, height=400):
+        """
+        Create word cloud PNG bytes from video titles, descriptions, or tags
+        Results are memoized per (dataset, source, max_words, size)
+        """
+        from wordcloud import WordCloud
         
-        # Collect text based on source
-        text_data = []
-        
-        if source == 'titles':
-            text_data = self.df['title'].dropna().tolist()
-        elif source == 'descriptions':
-            text_data = self.df['description'].dropna().tolist()
-        elif source == 'tags':
-            all_tags = []
-            for tags in self.df['tags'].dropna():
-                if isinstance(tags, list):
-                    all_tags.extend(tags)
-            text_data = all_tags
-        
-        if not text_data:
+        if self.df.empty:
             return None
         
-        # Combine all text
-        all_text = ' '.join(str(text) for text in text_data)
+        # Count keywords with the shared tokenizer so the cloud matches the keyword chart
+        keyword_counts = Counter(self._iter_keywords(source))
         
-        if not all_text.strip():
+        if not keyword_counts:
             return None
         
         try:
             # Create word cloud
             wordcloud = WordCloud(
-                font_path=font_path,
-                width=800,
-                height=400,
+                font_path=get_wordcloud_font_path(),
+                width=width,
+                height=height,
                 background_color='white',
                 max_words=max_words,
                 colormap='Reds',
                 relative_scaling=0.5,
                 random_state=42
-            ).generate(all_text)
+            ).generate_from_frequencies(keyword_counts)
             
-            # Create matplotlib figure
-            fig, ax = plt.subplots(figsize=(10, 5))
-            ax.imshow(wordcloud, interpolation='bilinear')
-            ax.axis('off')
-            ax.set_title(f'Word Cloud - {source.title()}', fontsize=16, pad=20)
-            
-            plt.tight_layout()
-            return fig
+            # Render straight to PNG (no Matplotlib figure to keep alive)
+            buffer = io.BytesIO()
+            wordcloud.to_image().save(buffer, format='PNG', optimize=True)
+            return buffer.getvalue()
             
         except Exception as e:
             print(f"Error creating word cloud: {e}")
             return None
     
+    @memoized
     def create_keywords_chart(self, source='titles', top_n=20):
         """Create bar chart of top keywords"""
+        import plotly.express as px
+        
         if self.df.empty:
             return self._create_empty_chart("No data available")
         
-        # Extract keywords based on source
-        all_keywords = []
-        
-        if source == 'titles':
-            for words in self.df['title_words'].dropna():
-                if isinstance(words, list):
-                    all_keywords.extend(words)
-        elif source == 'descriptions':
-            for words in self.df['description_words'].dropna():
-                if isinstance(words, list):
-                    all_keywords.extend(words)
-        elif source == 'tags':
-            for tags in self.df['tags'].dropna():
-                if isinstance(tags, list):
-                    all_keywords.extend([tag.lower() for tag in tags])
+        # Keyword frequencies (total occurrences) come from the shared keyword performance table
+        keyword_table = self.get_keyword_performance(source=source)
         
-        if not all_keywords:
+        if keyword_table.empty:
             return self._create_empty_chart(f"No {source} data available")
         
-        # Count keywords
-        keyword_counts = Counter(all_keywords)
-        top_keywords = dict(keyword_counts.most_common(top_n))
-        
-        if not top_keywords:
-            return self._create_empty_chart(f"No keywords found in {source}")
-        
         # Create bar chart
-        keywords_df = pd.DataFrame(list(top_keywords.items()), columns=['keyword', 'count'])
+        keywords_df = keyword_table.head(top_n)[['keyword', 'occurrences']].rename(
+            columns={'occurrences': 'count'}
+        )
         
         fig = px.bar(
             keywords_df,
@@ -498,76 +600,99 @@ class DataVisualizer:
         
         return fig
     
+    @memoized
     def analyze_successful_patterns(self):
         """Analyze patterns in successful videos"""
         if self.df.empty:
             return {}
         
-        # Define successful videos (top 25% by views)
-        view_threshold = self.df['view_count'].quantile(0.75)
-        successful_videos = self.df[self.df['view_count'] >= view_threshold]
-        
-        if successful_videos.empty:
+        # Define successful videos (top 25% by age-adjusted outlier score, not raw views,
+        # so old videos that merely had time to accumulate views do not dominate).
+        # Datasets the detector cannot score fall back to the top 25% by views.
+        outliers = self.get_outlier_engine()
+        if outliers.can_score:
+            successful = outliers.z >= np.quantile(outliers.z, 0.75)
+        else:
+            views = self.df['view_count'].to_numpy(dtype=float)
+            successful = views >= np.quantile(views, 0.75)
+        
+        if not successful.any():
             return {}
         
         patterns = {}
         
-        # Analyze keywords in successful videos
-        successful_keywords = []
-        for words in successful_videos['title_words'].dropna():
-            if isinstance(words, list):
-                successful_keywords.extend(words)
+        # Analyze keywords in successful videos via the postings index
+        keyword_index = self.get_keyword_index('titles')
         
-        if successful_keywords:
-            keyword_counts = Counter(successful_keywords)
-            top_keywords = {}
-            
-            for keyword, count in keyword_counts.most_common(10):
-                # Calculate average views for videos with this keyword
-                keyword_videos = self.df[self.df['title_words'].apply(
-                    lambda x: keyword in x if isinstance(x, list) else False
-                )]
-                
-                if not keyword_videos.empty:
-                    top_keywords[keyword] = {
-                        'count': count,
-                        'avg_views': keyword_videos['view_count'].mean()
-                    }
+        if len(keyword_index):
+            keyword_stats = keyword_index.keyword_stats(
+                self.df['view_count'].to_numpy(),
+                row_mask=successful
+            )
+            # Rank by occurrences in successful titles, as the keyword chart does
+            keyword_stats = keyword_stats[keyword_stats['selected_count'] > 0]
+            top_stats = keyword_stats.nlargest(10, 'selected_occurrences')
             
-            patterns['top_keywords'] = top_keywords
+            patterns['top_keywords'] = {
+                keyword: {
+                    'count': int(row['selected_occurrences']),
+                    'avg_views': row['avg_value'],
+                    'lift': row['lift']
+                }
+                for keyword, row in top_stats.iterrows()
+            }
         
-        # Analyze best upload times
-        time_performance = successful_videos.groupby(['day_of_week', 'hour_of_day']).agg({
-            'view_count': 'mean',
-            'video_id': 'count'
-        }).reset_index()
+        # Breakout videos far above their channel's age-adjusted baseline
+        patterns['overperformers'] = [
+            {
+                'title': row['title'],
+                'published_at': row['published_at'],
+                'view_count': int(row['view_count']),
+                'expected_views': float(row['expected_views']),
+                'outlier_score': float(row[OUTLIER_METRIC]),
+                'outlier_label': row['outlier_label']
+            }
+            for _, row in outliers.top_rows(10).iterrows()
+            if row[OUTLIER_METRIC] >= OVERPERFORMER_Z
+        ]
+        patterns['outlier_summary'] = outliers.summary()
         
-        time_performance = time_performance[time_performance['video_id'] >= 2]  # At least 2 videos
-        top_times = time_performance.nlargest(5, 'view_count')
+        # Best upload times over all videos, ranked by the shrunk slot mean
+        slots = self.get_slot_matrix()
+        counts = slots['count'].ravel()
+        shrunk = slots['view_count_shrunk'].ravel()
+        used = np.flatnonzero(counts)
+        best = used[np.argsort(-shrunk[used], kind='stable')[:5]]
         
         patterns['best_times'] = []
-        for _, row in top_times.iterrows():
+        for cell in best:
+            day, hour = divmod(int(cell), 24)
             patterns['best_times'].append({
-                'period': f"{row['day_of_week']} {row['hour_of_day']}:00",
-                'avg_views': row['view_count'],
-                'count': row['video_id']
+                'period': f"{WEEKDAY_NAMES[day]} {hour}:00",
+                'day': WEEKDAY_NAMES[day],
+                'hour': hour,
+                'avg_views': float(shrunk[cell]),
+                'median_views': float(slots['view_count_median'].ravel()[cell]),
+                'count': int(counts[cell])
             })
         
         return patterns
     
+    @memoized
     def generate_summary_report(self, channel_info):
         """Generate comprehensive summary report"""
         if self.df.empty:
             return {"error": "No data available for summary"}
         
         # Basic statistics
-        total_videos = len(self.df)
-        total_views = self.df['view_count'].sum()
-        total_likes = self.df['like_count'].sum()
-        total_comments = self.df['comment_count'].sum()
+        metrics = self.get_channel_metrics()
+        total_videos = metrics['total_videos']
+        total_views = metrics['total_views']
+        total_likes = metrics['total_likes']
+        total_comments = metrics['total_comments']
         
-        shorts_count = self.df['is_short'].sum()
-        long_form_count = total_videos - shorts_count
+        shorts_count = metrics['shorts_count']
+        long_form_count = metrics['long_form_count']
         
         # Performance metrics
         avg_views = self.df['view_count'].mean()
@@ -578,8 +703,7 @@ class DataVisualizer:
         top_video = self.df.loc[self.df['view_count'].idxmax()]
         
         # Upload patterns
-        most_active_day = self.df['day_of_week'].mode().iloc[0] if not self.df['day_of_week'].mode().empty else "N/A"
-        most_active_hour = self.df['hour_of_day'].mode().iloc[0] if not self.df['hour_of_day'].mode().empty else "N/A"
+        most_active_day, most_active_hour = self._most_active_slot()
         
         # Duration analysis
         avg_duration_shorts = self.df[self.df['is_short']]['duration_seconds'].mean() if shorts_count > 0 else 0
@@ -626,6 +750,247 @@ class DataVisualizer:
         
         return summary
     
+    def get_channel_metrics(self):
+        """Get the results-header KPIs, computed once per dataset"""
+        with self._build_lock:
+            if self._channel_metrics is None:
+                self._channel_metrics = compute_channel_metrics(self.df)
+        return self._channel_metrics
+    
+    @memoized
+    def get_figure_payload(self, chart, **params):
+        """
+        Build a chart (e.g. 'create_monthly_trends') once and keep it with its size and timing
+        
+        The chart method is called unmemoized so the payload is the only
+        cached copy of the figure. Returns None when the chart method returns
+        no figure.
+        """
+        start = time.perf_counter()
+        figure = inspect.unwrap(getattr(type(self), chart))(self, **params)
+        if figure is None:
+            return None
+        
+        return FigurePayload(figure, build_seconds=time.perf_counter() - start)
+    
+    def figure_payload_stats(self):
+        """Size and timing of the chart payloads currently in this dataset's memo cache"""
+        rows = []
+        for (chart,), params, payload in cached_results(self, 'get_figure_payload'):
+            if payload is None:
+                continue
+            rows.append({
+                'chart': chart,
+                'params': ', '.join(f"{k}={v}" for k, v in sorted(params.items())),
+                'traces': payload.trace_count,
+                'kb': round(payload.nbytes / 1024, 1),
+                'build_ms': round(payload.build_seconds * 1000, 1),
+                'serialize_ms': round(payload.serialize_seconds * 1000, 1)
+            })
+        return pd.DataFrame(rows, columns=['chart', 'params', 'traces', 'kb', 'build_ms', 'serialize_ms'])
+    
+    def get_time_cube(self):
+        """Get the month x weekday x hour x type aggregation cube, building it once per dataset"""
+        with self._build_lock:
+            if self._time_cube is None:
+                self._time_cube = TimeBucketCube(self.df)
+        return self._time_cube
+    
+    def get_trend_engine(self):
+        """Get the monthly series / growth / forecast engine, building it once per dataset"""
+        with self._build_lock:
+            if self._trend_engine is None:
+                self._trend_engine = TrendEngine(self.df)
+        return self._trend_engine
+    
+    def get_revenue_engine(self):
+        """Get the revenue estimate / simulation engine, building it once per dataset"""
+        with self._build_lock:
+            if self._revenue_engine is None:
+                self._revenue_engine = RevenueEngine(self.df)
+        return self._revenue_engine
+    
+    def get_rank_index(self):
+        """Get the per-metric rank orders shared by all top-N views, building it once per dataset"""
+        with self._build_lock:
+            if self._rank_index is None:
+                self._rank_index = RankIndex(self.df)
+        return self._rank_index
+    
+    def get_outlier_engine(self):
+        """
+        Get the breakout-video detector, building it once per dataset
+        
+        Upload ages are fixed when the engine is built; since visualizers are
+        cached per dataset, scores reflect the time of the first request.
+        """
+        with self._build_lock:
+            if self._outlier_engine is None:
+                self._outlier_engine = OutlierEngine(self.df)
+        return self._outlier_engine
+    
+    def _top_rows(self, metric, count):
+        """Top rows by a metric column, or by outlier score (with the scores attached)"""
+        if metric == OUTLIER_METRIC:
+            return self.get_outlier_engine().top_rows(count)
+        return self.get_rank_index().top_rows(metric, count)
+    
+    def get_insight_engine(self):
+        """Get the recommendation statistics engine, building it once per dataset"""
+        rank_index = self.get_rank_index()
+        trend_engine = self.get_trend_engine()
+        with self._build_lock:
+            if self._insight_engine is None:
+                self._insight_engine = InsightEngine(self.df, rank_index, trend_engine)
+        return self._insight_engine
+    
+    def get_video_table(self):
+        """Get the paginated detailed-data table with its sort indexes, building it once per dataset"""
+        with self._build_lock:
+            if self._video_table is None:
+                self._video_table = VideoTable(self.df)
+        return self._video_table
+    
+    def _most_active_slot(self):
+        """Return the weekday name and hour with the most uploads"""
+        cube = self.get_time_cube()
+        weekday_data = cube.by_weekday()
+        hourly_data = cube.by_hour()
+        
+        if weekday_data.empty or hourly_data.empty:
+            return "N/A", "N/A"
+        
+        most_active_day = weekday_data.loc[weekday_data['count'].idxmax(), 'day_of_week']
+        most_active_hour = int(hourly_data.loc[hourly_data['count'].idxmax(), 'hour_of_day'])
+        return most_active_day, most_active_hour
+    
+    def get_keyword_index(self, source='titles'):
+        """Get the keyword postings index for a source, building it once per dataset"""
+        with self._build_lock:
+            if source not in self._keyword_indexes:
+                self._keyword_indexes[source] = KeywordIndex(self._keyword_lists(source))
+        return self._keyword_indexes[source]
+    
+    @memoized
+    def get_keyword_performance(self, source='titles', min_support=1):
+        """Get frequency, views, engagement and lift for every keyword of a source"""
+        if self.df.empty:
+            return pd.DataFrame()
+        
+        return self.get_keyword_index(source).keyword_performance(
+            self.df['view_count'].to_numpy(),
+            engagement=self.df['engagement_rate'].to_numpy() if 'engagement_rate' in self.df.columns else None,
+            min_support=min_support
+        )
+    
+    def _keyword_lists(self, source='titles'):
+        """Yield one keyword list per row for titles, descriptions or tags"""
+        if source == 'tags':
+            for tags in self.df.get('tags', pd.Series(index=self.df.index, dtype=object)):
+                if isinstance(tags, list):
+                    yield [tag.strip().lower() for tag in tags if tag.strip()]
+                else:
+                    yield []
+            return
+        
+        words_column, text_column = {
+            'titles': ('title_words', 'title'),
+            'descriptions': ('description_words', 'description')
+        }.get(source, (None, None))
+        
+        if words_column in self.df.columns:
+            for words in self.df[words_column]:
+                yield words if isinstance(words, list) else []
+        elif text_column in self.df.columns:
+            for text in self.df[text_column]:
+                yield default_tokenizer.tokenize(text) if isinstance(text, str) else []
+    
+    def _iter_keywords(self, source='titles'):
+        """Yield keywords for titles, descriptions or tags using the shared tokenizer"""
+        for words in self._keyword_lists(source):
+            yield from words
+    
+    def _create_binned_histogram(self, values, title, label, log_scale=False, bins=DEFAULT_BIN_COUNT, color='#FF0000'):
+        """
+        Histogram from server-side bins: only bin positions and counts are sent to the browser
+        
+        Log-scale histograms are drawn on a log10 axis with ticks labelled in data units.
+        """
+        edges, counts = histogram_bins(values, bins=bins, log_scale=log_scale)
+        axis_edges = np.log10(edges) if log_scale else edges
+        
+        fig = go.Figure(go.Bar(
+            x=(axis_edges[:-1] + axis_edges[1:]) / 2,
+            y=counts,
+            width=np.diff(axis_edges),
+            marker_color=color,
+            customdata=np.column_stack([edges[:-1], edges[1:]]),
+            hovertemplate=f"{label}: %{{customdata[0]:,.0f}} ~ %{{customdata[1]:,.0f}}<br>영상 수: %{{y:,}}<extra></extra>"
+        ))
+        
+        fig.update_layout(title=title, xaxis_title=label, yaxis_title='영상 수', bargap=0.05)
+        
+        if log_scale:
+            decades = np.arange(np.floor(axis_edges[0]), np.ceil(axis_edges[-1]) + 1)
+            fig.update_xaxes(tickvals=decades, ticktext=[f"{10 ** d:,.0f}" for d in decades])
+        else:
+            fig.update_xaxes(tickformat=',')
+        
+        return fig
+    
+    def _create_type_scatter(self, x, y, title, labels, hover_column, log_x=True, log_y=True):
+        """
+        Scatter x vs y split by video type, with marker size by likes
+        
+        Large datasets are decimated (outliers are kept) and drawn with WebGL
+        traces, and hover labels carry only a truncated title and one extra column.
+        """
+        rows = decimate_points(
+            self.df[x].to_numpy(dtype=float),
+            self.df[y].to_numpy(dtype=float),
+            log_x=log_x,
+            log_y=log_y
+        )
+        sample = self.df.iloc[rows]
+        trace_type = go.Scattergl if len(sample) > WEBGL_POINT_THRESHOLD else go.Scatter
+        
+        max_likes = max(self.df['like_count'].max(), 1)
+        y_format = ',.2f' if self.df[y].dtype.kind == 'f' else ','
+        hover_template = (
+            f"%{{customdata[0]}}<br>{labels[x]}: %{{x:,}}<br>"
+            f"{labels[y]}: %{{y:{y_format}}}<br>%{{customdata[1]}}<extra></extra>"
+        )
+        
+        fig = go.Figure()
+        for is_short, name, color in ((True, '쇼츠', '#FF6B6B'), (False, '롱폼', '#4ECDC4')):
+            data = sample[sample['is_short'] == is_short]
+            if data.empty:
+                continue
+            
+            hover_values = data[hover_column]
+            if pd.api.types.is_datetime64_any_dtype(hover_values):
+                hover_values = hover_values.dt.strftime('%Y-%m-%d')
+            
+            fig.add_trace(trace_type(
+                x=data[x],
+                y=data[y],
+                mode='markers',
+                name=name,
+                marker=dict(
+                    color=color,
+                    size=np.round(4 + 16 * np.sqrt(data['like_count'].clip(lower=0) / max_likes), 1),
+                    opacity=0.7
+                ),
+                customdata=np.column_stack([truncate_titles(data['title']), hover_values.astype(str)]),
+                hovertemplate=hover_template
+            ))
+        
+        if len(sample) < len(self.df):
+            title += f" (전체 {len(self.df):,}개 중 {len(sample):,}개 표시)"
+        
+        fig.update_layout(title=title, xaxis_title=labels[x], yaxis_title=labels[y])
+        return fig
+    
     def _create_empty_chart(self, message):
         """Create empty chart with message"""
         fig = go.Figure()
@@ -0,0 +1,22 @@
+import time
+
+import plotly.io as pio
+
+
+class FigurePayload:
+    """
+    A built chart and its size and timing metrics
+
+    The figure is kept as built and handed to st.plotly_chart unchanged; it
+    is serialized once up front only to measure the payload size and cost.
+    """
+
+    def __init__(self, figure, build_seconds=0.0):
+        start = time.perf_counter()
+        text = pio.to_json(figure, validate=False)
+        self.serialize_seconds = time.perf_counter() - start
+
+        self.figure = figure
+        self.build_seconds = build_seconds
+        self.nbytes = len(text.encode('utf-8'))
+        self.trace_count = len(figure.data)
@@ -0,0 +1,47 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Worker threads shared by every session for building figures and analyses
+MAX_FIGURE_WORKERS = min(4, os.cpu_count() or 1)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """Return the process-wide figure-building pool, creating it on first use"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=MAX_FIGURE_WORKERS,
+                    thread_name_prefix='figures'
+                )
+    return _executor
+
+
+def _submit(function, *args, **kwargs):
+    """Run a call in the pool, or not at all on single-core hosts"""
+    if MAX_FIGURE_WORKERS <= 1:
+        return None
+    return get_executor().submit(function, *args, **kwargs)
+
+
+def prefetch_charts(visualizer, charts):
+    """
+    Start building independent chart payloads in the background
+
+    charts is a list of (chart, params) pairs as passed to
+    DataVisualizer.get_figure_payload. That method is memoized with in-flight
+    coalescing, so when the page later renders the charts in layout order it
+    picks up the background results (or waits for them) instead of building
+    them again. Returns the futures.
+    """
+    return [_submit(visualizer.get_figure_payload, chart, **params) for chart, params in charts]
+
+
+def prefetch_analyses(visualizer, methods):
+    """Start memoized, argument-free DataVisualizer analyses in the background"""
+    return [_submit(getattr(visualizer, method)) for method in methods]
@@ -0,0 +1,24 @@
+import numpy as np
+
+DEFAULT_BIN_COUNT = 30
+
+
+def histogram_bins(values, bins=DEFAULT_BIN_COUNT, log_scale=False):
+    """
+    Bin values server-side and return (edges, counts) in data units
+
+    With log_scale the bins are equal-width in log10 space, which suits
+    heavily skewed metrics such as view counts; values below 1 fall into
+    the first bin.
+    """
+    values = np.asarray(values, dtype=float)
+    values = values[np.isfinite(values)]
+    if not len(values):
+        return np.array([0.0, 1.0]), np.zeros(1, dtype=np.int64)
+
+    if log_scale:
+        counts, log_edges = np.histogram(np.log10(np.clip(values, 1, None)), bins=bins)
+        return 10 ** log_edges, counts
+
+    counts, edges = np.histogram(values, bins=bins)
+    return edges, counts
@@ -0,0 +1,136 @@
+from collections import Counter
+
+import numpy as np
+
+from analysis_cache import memoized
+from rank_index import RankIndex
+from text_tokenizer import tokenize_many
+from time_features import local_time
+from trend_engine import TrendEngine
+
+# Recommendations look at this many top videos by views
+TOP_VIDEO_COUNT = 10
+# Recent upload rhythm is measured over this many newest uploads
+RECENT_UPLOAD_COUNT = 5
+TITLE_WORD_COUNT = 10
+
+DAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+# Fallback slot when there is nothing to rank
+DEFAULT_UPLOAD_HOUR = 12
+DEFAULT_UPLOAD_DAY = 'Sunday'
+
+
+def _best_group(groups, views, n_groups):
+    """Group with the highest mean views and that mean, or (None, 0.0) when empty"""
+    counts = np.bincount(groups, minlength=n_groups)
+    if not counts.any():
+        return None, 0.0
+    totals = np.bincount(groups, weights=views, minlength=n_groups)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        means = np.where(counts > 0, totals / counts, -np.inf)
+    best = int(np.argmax(means))
+    return best, float(means[best])
+
+
+class InsightEngine:
+    """
+    Recommendation statistics for one dataset, shared by the trend, success-pattern and AI tabs
+
+    Works on the plain video DataFrame, so the same numbers can be produced
+    outside Streamlit. The rank index and trend engine are reused when given.
+    """
+
+    def __init__(self, df, rank_index=None, trend_engine=None):
+        self.df = df
+        self.rank_index = rank_index or RankIndex(df)
+        self.trend_engine = trend_engine or TrendEngine(df)
+
+        if df.empty:
+            self.views = np.zeros(0)
+            self.is_short = np.zeros(0, dtype=bool)
+            self.hours = np.zeros(0, dtype=np.int64)
+            self.weekdays = np.zeros(0, dtype=np.int64)
+            self.titles = []
+            return
+
+        published = local_time(df['published_at'])
+        self.views = np.nan_to_num(df['view_count'].to_numpy(dtype=float))
+        self.is_short = df['is_short'].fillna(False).astype(bool).to_numpy()
+        self.hours = published.dt.hour.to_numpy()
+        self.weekdays = published.dt.dayofweek.to_numpy()
+        self.titles = df['title'].fillna('').tolist()
+
+    def _top(self, top_n):
+        """Row positions of the top videos by views"""
+        return self.rank_index.top('view_count', top_n)
+
+    @memoized
+    def best_upload_slot(self, top_n=TOP_VIDEO_COUNT):
+        """Hour and weekday with the highest mean views among the top videos"""
+        top = self._top(top_n)
+        hour, hour_avg = _best_group(self.hours[top], self.views[top], 24)
+        day, day_avg = _best_group(self.weekdays[top], self.views[top], 7)
+        return {
+            'hour': DEFAULT_UPLOAD_HOUR if hour is None else hour,
+            'day': DEFAULT_UPLOAD_DAY if day is None else DAY_NAMES[day],
+            'hour_avg_views': hour_avg,
+            'day_avg_views': day_avg
+        }
+
+    @memoized
+    def format_advantage(self, top_n=TOP_VIDEO_COUNT):
+        """
+        Shorts versus long-form among the top videos and across the channel
+
+        recommended is 'short' when Shorts outnumber long-form videos among
+        the top videos, else 'long_form'.
+        """
+        top = self._top(top_n)
+        top_shorts = int(self.is_short[top].sum())
+        top_long_form = len(top) - top_shorts
+
+        format_index = self.is_short.astype(np.int64)
+        counts = np.bincount(format_index, minlength=2)
+        totals = np.bincount(format_index, weights=self.views, minlength=2)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            averages = np.where(counts > 0, totals / counts, 0.0)
+
+        return {
+            'top_shorts': top_shorts,
+            'top_long_form': top_long_form,
+            'recommended': 'short' if top_shorts > top_long_form else 'long_form',
+            'avg_views': {'short': float(averages[1]), 'long_form': float(averages[0])}
+        }
+
+    @memoized
+    def title_patterns(self, top_n=TOP_VIDEO_COUNT, word_count=TITLE_WORD_COUNT):
+        """Length, punctuation and common words of the top videos' titles (None without titles)"""
+        titles = [self.titles[row] for row in self._top(top_n) if self.titles[row]]
+        if not titles:
+            return None
+
+        return {
+            'title_count': len(titles),
+            'avg_length': sum(len(title) for title in titles) / len(titles),
+            'question_count': sum('?' in title for title in titles),
+            'exclamation_count': sum('!' in title for title in titles),
+            'top_words': Counter(tokenize_many(titles)).most_common(word_count)
+        }
+
+    @memoized
+    def gap_stats(self, recent_count=RECENT_UPLOAD_COUNT):
+        """
+        Upload rhythm: whole-day gaps between the newest uploads plus the full-history statistics
+
+        recent_mean_days is None when there are fewer than recent_count uploads.
+        """
+        published_ns = self.trend_engine.published_ns
+        recent_mean = None
+        if recent_count >= 2 and len(published_ns) >= recent_count:
+            gaps = np.diff(published_ns[-recent_count:]) // 86_400_000_000_000
+            recent_mean = float(gaps.mean())
+
+        return {
+            'recent_mean_days': recent_mean,
+            'history': self.trend_engine.upload_gaps()
+        }
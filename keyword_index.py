@@ -0,0 +1,154 @@
+import numpy as np
+import pandas as pd
+
+
+class KeywordIndex:
+    """Inverted keyword -> row-id postings index built once per dataset"""
+
+    def __init__(self, keyword_lists):
+        """
+        Build the index from one keyword list per row (row ids are positions)
+        """
+        keyword_ids = {}
+        rows = []
+        cols = []
+        n_rows = 0
+
+        for row_id, words in enumerate(keyword_lists):
+            n_rows = row_id + 1
+            if not isinstance(words, (list, tuple)):
+                continue
+            for word in words:
+                rows.append(row_id)
+                cols.append(keyword_ids.setdefault(word, len(keyword_ids)))
+
+        self.n_rows = n_rows
+        self.keywords = list(keyword_ids)
+        self.keyword_ids = keyword_ids
+
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+
+        # Deduplicate (keyword, row) pairs and sort postings by keyword, then row,
+        # keeping how often the keyword occurs in that row
+        occurrences = np.ones(len(rows), dtype=np.int64)
+        if len(rows):
+            pair_keys, occurrences = np.unique(cols * n_rows + rows, return_counts=True)
+            cols = pair_keys // n_rows
+            rows = pair_keys % n_rows
+
+        self.rows = rows
+        self.cols = cols
+        self.occurrences = occurrences
+        # Videos containing each keyword, and total occurrences across all videos
+        self.doc_freq = np.bincount(cols, minlength=len(self.keywords))
+        self.term_freq = np.bincount(cols, weights=occurrences, minlength=len(self.keywords)).astype(np.int64)
+        self.offsets = np.concatenate(([0], np.cumsum(self.doc_freq)))
+
+    def __len__(self):
+        return len(self.keywords)
+
+    def __contains__(self, keyword):
+        return keyword in self.keyword_ids
+
+    def postings(self, keyword):
+        """Return the sorted row ids containing a keyword"""
+        keyword_id = self.keyword_ids.get(keyword)
+        if keyword_id is None:
+            return np.empty(0, dtype=np.int64)
+        return self.rows[self.offsets[keyword_id]:self.offsets[keyword_id + 1]]
+
+    def keyword_stats(self, values, row_mask=None, keywords=None):
+        """
+        Aggregate a per-row metric for every keyword (or the given keywords) at once
+
+        Returns a DataFrame indexed by keyword with the number of rows containing
+        the keyword, its total occurrences, the mean metric value and its lift
+        versus the overall mean. With row_mask, also the number of selected
+        rows containing the keyword and its occurrences within them.
+        """
+        values = np.asarray(values, dtype=float)
+        n_keywords = len(self.keywords)
+
+        sums = np.bincount(self.cols, weights=values[self.rows], minlength=n_keywords)
+        counts = self.doc_freq
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            means = np.where(counts > 0, sums / counts, np.nan)
+
+        baseline = values.mean() if len(values) else np.nan
+        lift = means / baseline if baseline else np.full(n_keywords, np.nan)
+
+        stats = pd.DataFrame({
+            'count': counts,
+            'occurrences': self.term_freq,
+            'avg_value': means,
+            'lift': lift
+        }, index=pd.Index(self.keywords, name='keyword'))
+
+        if row_mask is not None:
+            row_mask = np.asarray(row_mask, dtype=bool)
+            selected = row_mask[self.rows]
+            stats['selected_count'] = np.bincount(self.cols[selected], minlength=n_keywords)
+            stats['selected_occurrences'] = np.bincount(
+                self.cols[selected], weights=self.occurrences[selected], minlength=n_keywords
+            ).astype(np.int64)
+
+        if keywords is not None:
+            stats = stats.reindex([k for k in keywords if k in self.keyword_ids])
+
+        return stats
+
+    def keyword_performance(self, views, engagement=None, min_support=1):
+        """
+        Compute a performance table for every keyword in one vectorized pass
+
+        The (row, keyword) postings form a sparse video x keyword incidence
+        matrix, so frequency, mean/median views, mean engagement and lift
+        versus the channel baseline all come from bincount and a single sort.
+        Keywords appearing in fewer than min_support videos are dropped. Rows
+        are ranked by total occurrences, then average views.
+        """
+        views = np.asarray(views, dtype=float)
+        counts = self.doc_freq
+        keep = counts >= max(min_support, 1)
+
+        columns = ['keyword', 'occurrences', 'video_count', 'avg_views', 'median_views', 'lift']
+        if engagement is not None:
+            columns.insert(5, 'avg_engagement')
+
+        if not keep.any():
+            return pd.DataFrame(columns=columns)
+
+        posting_views = views[self.rows]
+        view_sums = np.bincount(self.cols, weights=posting_views, minlength=len(self.keywords))
+
+        # Postings are already grouped by keyword; sort views within each group for medians
+        sorted_views = posting_views[np.lexsort((posting_views, self.cols))]
+        starts = self.offsets[:-1][keep]
+        kept_counts = counts[keep]
+        median_views = (
+            sorted_views[starts + (kept_counts - 1) // 2] +
+            sorted_views[starts + kept_counts // 2]
+        ) / 2
+
+        avg_views = view_sums[keep] / kept_counts
+        baseline = views.mean() if len(views) else 0
+
+        table = pd.DataFrame({
+            'keyword': np.asarray(self.keywords, dtype=object)[keep],
+            'occurrences': self.term_freq[keep],
+            'video_count': kept_counts,
+            'avg_views': avg_views,
+            'median_views': median_views,
+            'lift': avg_views / baseline if baseline else np.nan
+        })
+
+        if engagement is not None:
+            engagement = np.nan_to_num(np.asarray(engagement, dtype=float))
+            engagement_sums = np.bincount(
+                self.cols, weights=engagement[self.rows], minlength=len(self.keywords)
+            )
+            table.insert(5, 'avg_engagement', engagement_sums[keep] / kept_counts)
+
+        return table.sort_values(['occurrences', 'avg_views'], ascending=False, ignore_index=True)
@@ -0,0 +1,183 @@
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from analysis_cache import memoized
+
+# Score column exposed to top-N views alongside the raw metrics
+OUTLIER_METRIC = 'outlier_score'
+# Neighbouring uploads (by publish order) forming each video's baseline
+BASELINE_WINDOW = 21
+MIN_BASELINE_VIDEOS = 5
+# Quantile bins of upload age used to fit the view-accumulation slope
+AGE_BINS = 12
+
+VIRAL_Z = 3.5
+OVERPERFORMER_Z = 2.0
+UNDERPERFORMER_Z = -2.0
+LABELS = ('viral', 'overperformer', 'baseline', 'underperformer')
+
+SCORE_COLUMNS = ('expected_views', 'residual', OUTLIER_METRIC, 'outlier_label')
+
+
+def age_slope(log_age, log_views, bins=AGE_BINS):
+    """
+    Robust slope of log views on log upload age
+
+    Takes the median age and views of quantile age bins, then the median of
+    pairwise slopes between bins (Theil-Sen over the bins), clipped to [0, 1]
+    since views only accumulate and do not grow faster than age.
+    """
+    if len(log_age) < 2:
+        return 0.0
+    edges = np.unique(np.quantile(log_age, np.linspace(0, 1, bins + 1)))
+    if len(edges) < 3:
+        return 0.0
+
+    codes = np.clip(np.searchsorted(edges, log_age, side='right') - 1, 0, len(edges) - 2)
+    medians = pd.DataFrame({'bin': codes, 'x': log_age, 'y': log_views}).groupby('bin').median()
+    x = medians['x'].to_numpy()
+    y = medians['y'].to_numpy()
+
+    i, j = np.triu_indices(len(x), k=1)
+    dx = x[j] - x[i]
+    keep = dx > 0
+    if not keep.any():
+        return 0.0
+    return float(np.clip(np.median((y[j] - y[i])[keep] / dx[keep]), 0.0, 1.0))
+
+
+def score_videos(published, views, groups=None, now=None, window=BASELINE_WINDOW):
+    """
+    Score videos against an age-adjusted rolling baseline, one pass over many channels
+
+    Views are taken as log1p and adjusted for upload age with a pooled robust
+    slope on log(days since upload). Each video's baseline is the rolling
+    median of the adjusted values over its `window` neighbouring uploads in
+    the same group (channel). The residual is divided by the group's robust
+    scale (1.4826 x MAD) to give a z-score. Returns a frame aligned with the
+    inputs holding expected_views, residual, outlier_score and outlier_label.
+    """
+    published = pd.to_datetime(pd.Series(published).reset_index(drop=True), utc=True)
+    views = np.nan_to_num(np.asarray(views, dtype=float))
+    groups = np.zeros(len(views), dtype=np.int64) if groups is None else np.asarray(groups)
+    if not len(views):
+        return pd.DataFrame({column: [] for column in SCORE_COLUMNS})
+
+    now = pd.Timestamp(now or datetime.now(timezone.utc))
+    # Naive values are taken as UTC, like published_at
+    now = now.tz_localize('UTC') if now.tzinfo is None else now.tz_convert('UTC')
+    age_days = np.maximum((now - published).dt.total_seconds().to_numpy() / 86_400, 1.0)
+    log_age = np.log(age_days)
+    log_views = np.log1p(np.clip(views, 0, None))
+    adjusted = log_views - age_slope(log_age, log_views) * log_age
+
+    # Rolling median per group in publish order, then back to input order
+    frame = pd.DataFrame({'group': groups, 'published': published, 'adjusted': adjusted})
+    frame = frame.sort_values(['group', 'published'], kind='stable')
+    grouped = frame.groupby('group', sort=False)['adjusted']
+    baseline = grouped.transform(
+        lambda s: s.rolling(window, center=True, min_periods=MIN_BASELINE_VIDEOS).median()
+    )
+    # Channels too small for a rolling window fall back to their overall median
+    baseline = baseline.fillna(grouped.transform('median')).sort_index().to_numpy()
+
+    residual = adjusted - baseline
+    residual_series = pd.Series(residual).groupby(groups)
+    deviation = np.abs(residual - residual_series.transform('median').to_numpy())
+    scale = 1.4826 * pd.Series(deviation).groupby(groups).transform('median').to_numpy()
+    # Channels with too few videos to tell a breakout from noise score 0
+    group_size = pd.Series(residual).groupby(groups).transform('size').to_numpy()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z = np.where((scale > 0) & (group_size >= MIN_BASELINE_VIDEOS), residual / scale, 0.0)
+
+    label = np.select(
+        [z >= VIRAL_Z, z >= OVERPERFORMER_Z, z <= UNDERPERFORMER_Z],
+        ['viral', 'overperformer', 'underperformer'],
+        default='baseline'
+    )
+    return pd.DataFrame({
+        'expected_views': np.expm1(log_views - residual),
+        'residual': residual,
+        OUTLIER_METRIC: z,
+        'outlier_label': label
+    })
+
+
+class OutlierEngine:
+    """
+    Breakout (viral / overperforming) video detection for one dataset
+
+    Upload ages are measured against `now` (default: the current time) when
+    the engine is built and are not refreshed afterwards. Callers that keep
+    an engine for a long time should rebuild it or pass an explicit now.
+    """
+
+    def __init__(self, df, now=None):
+        self.df = df
+        self.now = pd.Timestamp(now or datetime.now(timezone.utc))
+        if df.empty:
+            self.scores = pd.DataFrame({column: [] for column in SCORE_COLUMNS})
+        else:
+            self.scores = score_videos(df['published_at'], df['view_count'], now=self.now)
+        self.z = self.scores[OUTLIER_METRIC].to_numpy(dtype=float)
+        # Highest score first, ties in row order
+        self.order = np.argsort(-self.z, kind='stable')
+
+    @property
+    def can_score(self):
+        """
+        Whether the scores separate videos at all
+
+        Channels below MIN_BASELINE_VIDEOS or with zero spread score 0 across
+        the board, in which case callers should rank by another metric.
+        """
+        return len(self.z) > 0 and np.ptp(self.z) > 0
+
+    def top(self, n):
+        """Row positions of the n highest-scoring videos"""
+        return self.order[:max(int(n), 0)]
+
+    def top_rows(self, n):
+        """The n highest-scoring videos with their scores attached, in rank order"""
+        rows = self.top(n)
+        top = self.df.iloc[rows].copy()
+        for column in SCORE_COLUMNS:
+            top[column] = self.scores[column].to_numpy()[rows]
+        return top
+
+    @memoized
+    def summary(self):
+        """Video count per label"""
+        counts = self.scores['outlier_label'].value_counts()
+        return {label: int(counts.get(label, 0)) for label in LABELS}
+
+
+def score_channels(channel_frames, now=None, window=BASELINE_WINDOW):
+    """
+    Score every video of many channels in one vectorized pass
+
+    channel_frames maps a channel name to its video DataFrame. Baselines and
+    scales are per channel; the age slope is pooled. Returns the score
+    columns plus channel and the video's position in its frame.
+    """
+    names = list(channel_frames)
+    frames = [channel_frames[name] for name in names]
+    sizes = [len(frame) for frame in frames]
+    columns = ['channel', 'position'] + list(SCORE_COLUMNS)
+    if not sum(sizes):
+        return pd.DataFrame(columns=columns)
+
+    present = [frame for frame in frames if len(frame)]
+    groups = np.repeat(np.arange(len(names)), sizes)
+    scores = score_videos(
+        pd.concat([frame['published_at'] for frame in present], ignore_index=True),
+        np.concatenate([frame['view_count'].to_numpy(dtype=float) for frame in present]),
+        groups=groups,
+        now=now,
+        window=window
+    )
+    scores.insert(0, 'channel', [names[g] for g in groups])
+    scores.insert(1, 'position', np.concatenate([np.arange(size) for size in sizes]))
+    return scores[columns]
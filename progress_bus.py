@@ -0,0 +1,112 @@
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+# Default publish rate and message history size
+DEFAULT_MAX_RATE_HZ = 4
+DEFAULT_HISTORY_SIZE = 200
+
+
+class ProgressEventBus:
+    """
+    Coalesces collection progress events and publishes them at a fixed rate
+
+    Producers call publish() as often as they like (e.g. once per video);
+    subscribers receive at most max_rate_hz snapshots per second plus the
+    final one, and only published snapshots are kept in a bounded ring buffer.
+    """
+
+    def __init__(self, max_rate_hz=DEFAULT_MAX_RATE_HZ, history_size=DEFAULT_HISTORY_SIZE,
+                 messages=None, clock=time.monotonic):
+        self.min_interval = 1.0 / max_rate_hz if max_rate_hz > 0 else 0
+        self.messages = messages if messages is not None else deque(maxlen=history_size)
+        self.clock = clock
+        self._subscribers = []
+        self._lock = threading.Lock()
+        self._started_at = None
+        self._last_emit = None
+        self._pending = None
+        self.latest = None
+
+    def subscribe(self, callback):
+        """Register callback(snapshot) to receive throttled progress snapshots"""
+        self._subscribers.append(callback)
+        return callback
+
+    def log(self, message):
+        """Append a timestamped message to the ring buffer"""
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        self.messages.append(f"[{timestamp}] {message}")
+
+    def publish(self, current, total, message, api_calls=None):
+        """Record a progress event; emits only if the rate limit allows or the work is done"""
+        now = self.clock()
+
+        with self._lock:
+            if self._started_at is None:
+                self._started_at = now
+
+            self._pending = self._snapshot(now, current, total, message, api_calls)
+            done = total > 0 and current >= total
+            due = self._last_emit is None or now - self._last_emit >= self.min_interval
+
+            if not (done or due):
+                return False
+
+            snapshot = self._pending
+            self._pending = None
+            self._last_emit = now
+            self.latest = snapshot
+
+        self._emit(snapshot)
+        return True
+
+    def flush(self):
+        """Emit the last coalesced event, if any is pending"""
+        with self._lock:
+            snapshot = self._pending
+            self._pending = None
+            if snapshot is not None:
+                self._last_emit = self.clock()
+                self.latest = snapshot
+
+        if snapshot is not None:
+            self._emit(snapshot)
+
+    def _emit(self, snapshot):
+        """Log a snapshot and hand it to subscribers"""
+        self.log(format_progress(snapshot))
+        for callback in list(self._subscribers):
+            callback(snapshot)
+
+    def _snapshot(self, now, current, total, message, api_calls):
+        """Build a progress snapshot with throughput and ETA"""
+        elapsed = now - self._started_at
+        rate = current / elapsed if elapsed > 0 else 0
+        remaining = max(total - current, 0)
+
+        return {
+            'current': current,
+            'total': total,
+            'message': message,
+            'progress': min(current / total, 1.0) if total > 0 else 0,
+            'elapsed_seconds': elapsed,
+            'videos_per_second': rate,
+            'eta_seconds': remaining / rate if rate > 0 else None,
+            'api_calls': api_calls
+        }
+
+
+def format_progress(snapshot):
+    """Format a progress snapshot as a single status line"""
+    text = f"{snapshot['message']} ({snapshot['current']}/{snapshot['total']})"
+
+    if snapshot['videos_per_second'] > 0:
+        text += f" · {snapshot['videos_per_second']:.1f}개/초"
+    if snapshot['eta_seconds'] is not None and snapshot['current'] < snapshot['total']:
+        text += f" · 남은 시간 약 {snapshot['eta_seconds']:.0f}초"
+    if snapshot['api_calls'] is not None:
+        text += f" · API 호출 {snapshot['api_calls']}회"
+
+    return text
@@ -0,0 +1,53 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+# Metrics that top-N views rank by (published_at ranks newest first)
+RANKED_METRICS = ('view_count', 'like_count', 'comment_count', 'engagement_rate', 'published_at')
+
+
+class RankIndex:
+    """
+    Per-metric descending rank orders shared by every top-N consumer
+
+    Each metric's order is computed once (a stable argsort) on first use;
+    afterwards any top-N request is a slice. Missing values rank last.
+    """
+
+    def __init__(self, df):
+        self.df = df
+        self.n_rows = len(df)
+        self._orders = {}
+        self._lock = threading.Lock()
+
+    def _sort_keys(self, metric):
+        """Numeric keys for a metric (timestamps as int64 nanoseconds, NaN as -inf)"""
+        column = self.df[metric]
+        if metric == 'published_at':
+            published = pd.to_datetime(column, utc=True).dt.tz_localize(None)
+            keys = published.to_numpy(dtype='datetime64[ns]').astype(np.int64).astype(float)
+            keys[published.isna().to_numpy()] = -np.inf
+            return keys
+        keys = pd.to_numeric(column, errors='coerce').to_numpy(dtype=float)
+        return np.where(np.isnan(keys), -np.inf, keys)
+
+    def order(self, metric):
+        """Row positions sorted by metric, highest first (ties keep row order)"""
+        order = self._orders.get(metric)
+        if order is None:
+            # Stable descending sort: ascending sort of the negated keys
+            order = np.argsort(-self._sort_keys(metric), kind='stable')
+            with self._lock:
+                order = self._orders.setdefault(metric, order)
+        return order
+
+    def top(self, metric, n):
+        """Row positions of the n highest rows by metric"""
+        if metric not in self.df.columns:
+            return np.empty(0, dtype=np.int64)
+        return self.order(metric)[:max(int(n), 0)]
+
+    def top_rows(self, metric, n):
+        """DataFrame of the n highest rows by metric, in rank order"""
+        return self.df.iloc[self.top(metric, n)]
@@ -0,0 +1,178 @@
+from datetime import datetime, timezone
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+FORMATS = ('short', 'long_form')
+RECENT_DAYS = 30
+SIMULATION_SCENARIOS = 10_000
+SIMULATION_PERCENTILES = (10, 50, 90)
+# Growth compares the newest GROWTH_WINDOW uploads with the GROWTH_WINDOW before them
+GROWTH_WINDOW = 5
+
+_Z90 = NormalDist().inv_cdf(0.9)
+
+
+class RpmDistribution:
+    """
+    Log-normal RPM (revenue per 1,000 views, USD) given by its median and 90th percentile
+    """
+
+    def __init__(self, median, p90=None):
+        self.median = float(median)
+        self.p90 = float(p90) if p90 is not None else self.median * 2.5
+        self.mu = np.log(max(self.median, 1e-9))
+        self.sigma = max(np.log(max(self.p90, 1e-9)) - self.mu, 0.0) / _Z90
+
+    @property
+    def p90_ratio(self):
+        """How many times the median the 90th percentile is"""
+        return self.p90 / self.median if self.median > 0 else 1.0
+
+    def with_median(self, median):
+        """Same spread (p90 / median ratio) around a different median"""
+        return RpmDistribution(median, median * self.p90_ratio)
+
+    def sample(self, rng, size):
+        """Draw RPM values"""
+        return rng.lognormal(self.mu, self.sigma, size=size)
+
+
+# Industry-typical defaults: Shorts earn a small fraction of long-form RPM
+DEFAULT_RPM = {
+    'short': RpmDistribution(median=0.1, p90=0.3),
+    'long_form': RpmDistribution(median=1.5, p90=4.0)
+}
+
+
+def _format_index(is_short):
+    """0 for Shorts, 1 for long-form (matches FORMATS)"""
+    return np.where(np.asarray(is_short, dtype=bool), 0, 1)
+
+
+def _views_by_format(views, format_index):
+    """Sum views per format"""
+    return np.bincount(format_index, weights=views, minlength=len(FORMATS))
+
+
+def _rpm_samples(rpm, rng, size):
+    """Draw (size x formats) RPM scenarios"""
+    return np.stack([rpm[f].sample(rng, size) for f in FORMATS], axis=-1)
+
+
+class RevenueEngine:
+    """Vectorized revenue estimates and scenario simulation for one dataset"""
+
+    def __init__(self, df):
+        self.n_videos = len(df)
+        if self.n_videos == 0:
+            self.views = np.zeros(0)
+            self.format_index = np.zeros(0, dtype=np.int64)
+            self.published_ns = np.zeros(0, dtype=np.int64)
+            return
+
+        self.views = np.nan_to_num(df['view_count'].to_numpy(dtype=float))
+        self.format_index = _format_index(df['is_short'].fillna(False).astype(bool).to_numpy())
+        published = pd.to_datetime(df['published_at'], utc=True).dt.tz_localize(None)
+        self.published_ns = published.to_numpy(dtype='datetime64[ns]').astype(np.int64)
+
+    def video_revenue(self, rpm=DEFAULT_RPM):
+        """Per-video ad revenue estimate at the median RPM of each video's format"""
+        medians = np.array([rpm[f].median for f in FORMATS])
+        return self.views / 1000 * medians[self.format_index]
+
+    def recent_mask(self, days=RECENT_DAYS, now=None):
+        """Videos published within the last `days` days"""
+        now = now or datetime.now(timezone.utc)
+        cutoff = pd.Timestamp(now).tz_convert('UTC').tz_localize(None) - pd.Timedelta(days=days)
+        return self.published_ns >= cutoff.value
+
+    def growth_pct(self):
+        """
+        Average views of the newest GROWTH_WINDOW uploads versus the GROWTH_WINDOW before them
+        """
+        if self.n_videos < 2 * GROWTH_WINDOW:
+            return None
+
+        newest_first = np.argsort(self.published_ns)[::-1]
+        recent = self.views[newest_first[:GROWTH_WINDOW]].mean()
+        older = self.views[newest_first[GROWTH_WINDOW:2 * GROWTH_WINDOW]].mean()
+        return float((recent - older) / older * 100) if older > 0 else 0.0
+
+    def summary(self, rpm=DEFAULT_RPM, days=RECENT_DAYS, now=None):
+        """Point estimates of total and recent revenue, split by format"""
+        revenue = self.video_revenue(rpm)
+        recent = self.recent_mask(days, now)
+
+        total_by_format = np.bincount(self.format_index, weights=revenue, minlength=len(FORMATS))
+        recent_by_format = np.bincount(
+            self.format_index[recent], weights=revenue[recent], minlength=len(FORMATS)
+        )
+
+        return {
+            'total_revenue': float(total_by_format.sum()),
+            'recent_revenue': float(recent_by_format.sum()),
+            'recent_views': float(self.views[recent].sum()),
+            'revenue_by_format': dict(zip(FORMATS, total_by_format.tolist())),
+            'recent_revenue_by_format': dict(zip(FORMATS, recent_by_format.tolist())),
+            'growth_pct': self.growth_pct()
+        }
+
+    def simulate(self, rpm=DEFAULT_RPM, days=RECENT_DAYS, n_scenarios=SIMULATION_SCENARIOS,
+                 percentiles=SIMULATION_PERCENTILES, seed=0, now=None):
+        """
+        Monte Carlo of total and recent revenue under uncertain per-format RPM
+
+        Each scenario draws one RPM per format (RPM varies by channel and
+        season far more than by video). Returns percentile bands and the mean.
+        """
+        rng = np.random.default_rng(seed)
+        samples = _rpm_samples(rpm, rng, n_scenarios)
+        recent = self.recent_mask(days, now)
+
+        totals = samples @ (_views_by_format(self.views, self.format_index) / 1000)
+        recents = samples @ (_views_by_format(self.views[recent], self.format_index[recent]) / 1000)
+
+        return {
+            'total': dict(zip(percentiles, np.percentile(totals, percentiles).tolist())),
+            'recent': dict(zip(percentiles, np.percentile(recents, percentiles).tolist())),
+            'total_mean': float(totals.mean()),
+            'recent_mean': float(recents.mean())
+        }
+
+
+def simulate_portfolio(channel_frames, rpm=DEFAULT_RPM, days=RECENT_DAYS, n_scenarios=SIMULATION_SCENARIOS,
+                       percentiles=SIMULATION_PERCENTILES, seed=0, now=None):
+    """
+    Simulate recent revenue for many channels at once and rank them
+
+    channel_frames maps a channel name to its video DataFrame. Every channel
+    draws its own RPM scenarios. Returns one row per channel with percentile
+    columns (p10, p50, ...) and the mean, sorted by the median.
+    """
+    names = []
+    views = []
+    for name, df in channel_frames.items():
+        engine = RevenueEngine(df)
+        recent = engine.recent_mask(days, now)
+        names.append(name)
+        views.append(_views_by_format(engine.views[recent], engine.format_index[recent]) / 1000)
+
+    columns = ['channel'] + [f'p{p}' for p in percentiles] + ['mean']
+    if not names:
+        return pd.DataFrame(columns=columns)
+
+    # (scenarios x channels x formats) RPM draws against (channels x formats) views
+    rng = np.random.default_rng(seed)
+    samples = _rpm_samples(rpm, rng, (n_scenarios, len(names)))
+    revenue = (samples * np.asarray(views)[None, :, :]).sum(axis=-1)
+
+    bands = np.percentile(revenue, percentiles, axis=0)
+    result = pd.DataFrame({'channel': names})
+    for p, band in zip(percentiles, bands):
+        result[f'p{p}'] = band
+    result['mean'] = revenue.mean(axis=0)
+
+    rank_column = f'p{percentiles[len(percentiles) // 2]}'
+    return result.sort_values(rank_column, ascending=False, ignore_index=True)[columns]
@@ -0,0 +1,160 @@
+import unicodedata
+
+import numpy as np
+
+# Documents are indexed in chunks to bound the temporary code point arrays
+BUILD_CHUNK_CHARS = 4_000_000
+# Code points fit in 21 bits, so a bigram packs into one int64
+_CODE_BITS = 21
+_DOC_MASK = (1 << _CODE_BITS) - 1
+
+
+def normalize_text(text):
+    """
+    Normalize text for literal search: NFKC (composes Hangul jamo into
+    syllables, folds full-width forms) followed by case folding
+    """
+    if not isinstance(text, str):
+        text = '' if text is None else str(text)
+    return unicodedata.normalize('NFKC', text).casefold()
+
+
+def _code_points(texts):
+    """Concatenate texts into one code point array with 0 separators, plus the doc id of every char"""
+    joined = '\x00'.join(texts) + '\x00'
+    codes = np.frombuffer(joined.encode('utf-32-le'), dtype=np.uint32).astype(np.int64)
+    lengths = np.fromiter((len(t) + 1 for t in texts), dtype=np.int64, count=len(texts))
+    return codes, np.repeat(np.arange(len(texts), dtype=np.int64), lengths)
+
+
+class _Postings:
+    """Sorted (gram, doc) pairs with per-gram offsets"""
+
+    def __init__(self, grams, docs):
+        if len(grams):
+            order = np.lexsort((docs, grams))
+            grams = grams[order]
+            docs = docs[order]
+        self.docs = docs
+        self.grams, starts = np.unique(grams, return_index=True)
+        self.offsets = np.append(starts, len(grams)).astype(np.int64)
+
+    def get(self, gram):
+        """Sorted doc ids containing a gram"""
+        i = int(np.searchsorted(self.grams, gram))
+        if i == len(self.grams) or self.grams[i] != gram:
+            return self.docs[:0]
+        return self.docs[self.offsets[i]:self.offsets[i + 1]]
+
+
+class NgramIndex:
+    """
+    Character unigram/bigram inverted index for literal substring search
+
+    Built once per dataset. A query term's bigrams (or its single character)
+    select candidate documents by posting-list intersection; terms longer than
+    two characters are then confirmed with a substring check on the candidates
+    only. Hangul syllables are single code points after NFKC normalization, so
+    Korean text is indexed per syllable.
+    """
+
+    def __init__(self, documents):
+        self.texts = [normalize_text(doc) for doc in documents]
+        self.n_docs = len(self.texts)
+
+        unigram_parts = []
+        bigram_parts = []
+        for start, stop in self._chunks():
+            codes, local_doc = _code_points(self.texts[start:stop])
+            is_char = codes != 0
+            both = is_char[:-1] & is_char[1:]
+            bigrams = (codes[:-1][both] << _CODE_BITS) | codes[1:][both]
+
+            # Unique (gram, doc) pairs within the chunk, packed as gram << 21 | doc
+            unigram_parts.append(self._unique_pairs(codes[is_char], local_doc[is_char], start))
+            bigram_parts.append(self._unique_pairs(bigrams, local_doc[:-1][both], start))
+
+        self._unigrams = self._merge(unigram_parts)
+        self._bigrams = self._merge(bigram_parts)
+
+    def _chunks(self):
+        """Yield (start, stop) document ranges of roughly BUILD_CHUNK_CHARS characters"""
+        start = 0
+        size = 0
+        for i, text in enumerate(self.texts):
+            size += len(text) + 1
+            if size >= BUILD_CHUNK_CHARS or i + 1 - start > _DOC_MASK:
+                yield start, i + 1
+                start = i + 1
+                size = 0
+        if start < self.n_docs:
+            yield start, self.n_docs
+
+    @staticmethod
+    def _unique_pairs(grams, local_docs, start):
+        """Deduplicate (gram, doc) pairs of one chunk and return them as two arrays"""
+        pair_key = np.unique((grams << _CODE_BITS) | local_docs)
+        return pair_key >> _CODE_BITS, (pair_key & _DOC_MASK) + start
+
+    def _merge(self, parts):
+        """Combine per-chunk pairs (chunks cover disjoint documents) into postings"""
+        if parts:
+            grams = np.concatenate([p[0] for p in parts])
+            docs = np.concatenate([p[1] for p in parts])
+        else:
+            grams = docs = np.empty(0, dtype=np.int64)
+        return _Postings(grams, docs)
+
+    def __len__(self):
+        return self.n_docs
+
+    def candidates(self, term):
+        """Sorted doc ids whose unigrams/bigrams cover the (normalized) term"""
+        if not term:
+            return np.arange(self.n_docs)
+        codes = [ord(c) for c in term]
+        if len(codes) == 1:
+            return self._unigrams.get(codes[0])
+
+        grams = {(a << _CODE_BITS) | b for a, b in zip(codes, codes[1:])}
+        postings = sorted((self._bigrams.get(g) for g in grams), key=len)
+        result = postings[0]
+        for other in postings[1:]:
+            if not len(result):
+                break
+            result = np.intersect1d(result, other, assume_unique=True)
+        return result
+
+    def search_term(self, term):
+        """Sorted doc ids containing the literal term"""
+        term = normalize_text(term)
+        candidates = self.candidates(term)
+        if len(term) <= 2:
+            return candidates
+        texts = self.texts
+        return candidates[np.fromiter((term in texts[d] for d in candidates), dtype=bool, count=len(candidates))]
+
+    def search(self, query):
+        """
+        Sorted doc ids containing every whitespace-separated term of the query
+
+        Terms are matched literally (no regex), case-insensitively.
+        """
+        terms = sorted(set(normalize_text(query).split()), key=len, reverse=True)
+        if not terms:
+            return np.arange(self.n_docs)
+
+        # Longest terms first: they tend to have the shortest candidate lists
+        result = None
+        for term in terms:
+            rows = self.search_term(term)
+            result = rows if result is None else np.intersect1d(result, rows, assume_unique=True)
+            if not len(result):
+                break
+        return result
+
+    def mask(self, query):
+        """Boolean doc mask for search()"""
+        keep = np.zeros(self.n_docs, dtype=bool)
+        keep[self.search(query)] = True
+        return keep
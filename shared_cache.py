@@ -0,0 +1,163 @@
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+# Defaults for the process-wide channel dataset cache
+DEFAULT_MEMORY_BUDGET_BYTES = 512 * 1024 * 1024
+DEFAULT_TTL_SECONDS = 15 * 60
+
+# How often waiting callers check their cancel event
+WAIT_POLL_SECONDS = 0.25
+
+
+def estimate_size(value):
+    """Rough in-memory size of a cached value (its pickled length)"""
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return 0
+
+
+class _Flight:
+    """An in-flight computation other callers can wait on"""
+
+    def __init__(self, owner=None):
+        self.owner = owner
+        self.done = threading.Event()
+        self.value = None
+        self.complete = False
+
+
+class SharedResultCache:
+    """
+    Process-wide LRU cache with a memory budget and single-flight coalescing
+
+    Concurrent get_or_compute calls for the same key share one computation:
+    the first caller computes, the others wait for its result.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MEMORY_BUDGET_BYTES, ttl_seconds=DEFAULT_TTL_SECONDS,
+                 size_of=estimate_size):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.size_of = size_of
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+        self._entries = OrderedDict()
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return a fresh cached value or None"""
+        with self._lock:
+            return self._get_locked(key)
+
+    def get_or_compute(self, key, compute, owner=None, on_wait=None, is_complete=None,
+                       cancel_event=None):
+        """
+        Return the cached value for key, computing it at most once at a time
+
+        owner is attached to the in-flight computation and passed to on_wait
+        for callers that end up waiting on it. Results for which is_complete
+        returns False (e.g. cancelled collections) are returned to the leader
+        but not cached, and waiting callers start over. Likewise, when the
+        leader raises, only the leader sees the error: waiting callers start
+        over (one becoming the new leader) instead of inheriting a failure
+        that may be specific to the leader, such as its API key or quota.
+        A waiting caller whose cancel_event is set stops waiting and gets None.
+        """
+        while True:
+            with self._lock:
+                value = self._get_locked(key)
+                if value is not None:
+                    self.hits += 1
+                    return value
+
+                flight = self._in_flight.get(key)
+                leader = flight is None
+                if leader:
+                    flight = self._in_flight[key] = _Flight(owner)
+                    self.misses += 1
+                else:
+                    self.coalesced += 1
+
+            if leader:
+                return self._lead(key, flight, compute, is_complete)
+
+            if on_wait is not None:
+                on_wait(flight.owner)
+            while not flight.done.wait(WAIT_POLL_SECONDS):
+                if cancel_event is not None and cancel_event.is_set():
+                    return None
+
+            if flight.complete:
+                return flight.value
+            # The leader failed or gave up (e.g. was cancelled); try again
+
+    def stats(self):
+        """Cache statistics for display"""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'total_bytes': self.total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'coalesced': self.coalesced,
+                'in_flight': len(self._in_flight)
+            }
+
+    def _lead(self, key, flight, compute, is_complete):
+        """Run the computation as the leader and publish its result"""
+        try:
+            value = compute()
+            flight.value = value
+            flight.complete = is_complete(value) if is_complete is not None else True
+            if flight.complete:
+                self._store(key, value)
+            return value
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            flight.done.set()
+
+    def _get_locked(self, key):
+        """Look up a fresh entry (caller holds the lock)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, size, stored_at = entry
+        if self.ttl_seconds is not None and time.time() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            self.total_bytes -= size
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def _store(self, key, value):
+        """Insert a value and evict least recently used entries over the budget"""
+        size = self.size_of(value)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.total_bytes -= previous[1]
+
+            self._entries[key] = (value, size, time.time())
+            self.total_bytes += size
+
+            while self.total_bytes > self.max_bytes and self._entries:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self.total_bytes -= evicted_size
+
+
+# Collected channel datasets shared by every session in this process
+channel_datasets = SharedResultCache()
@@ -0,0 +1,109 @@
+import re
+
+# Precompiled patterns shared by every tokenizer instance
+WORD_PATTERN = re.compile(r'[\w가-힣]+')
+HANGUL_WORD_PATTERN = re.compile(r'^[가-힣]+$')
+
+# Common Korean particles (조사), longest first so that e.g. '에서' wins over '서'
+HANGUL_PARTICLES = (
+    '으로부터', '에게서', '으로서', '으로써', '이라고', '에서는', '에서도',
+    '으로', '에서', '에게', '까지', '부터', '처럼', '보다', '한테', '이랑', '라고',
+    '은', '는', '이', '가', '을', '를', '에', '의', '와', '과', '도', '로', '만', '랑'
+)
+PARTICLE_PATTERN = re.compile(
+    r'^([가-힣]{2,}?)(' + '|'.join(HANGUL_PARTICLES) + r')$'
+)
+
+# Common stop words (Korean and English)
+DEFAULT_STOP_WORDS = frozenset({
+    '그리고', '하지만', '그래서', '그런데', '그러나', '또한', '그냥', '정말', '진짜', '너무',
+    'and', 'but', 'the', 'for', 'are', 'with', 'this', 'that', 'from', 'they', 'have',
+    'been', 'will', 'what', 'when', 'where', 'how', 'why', 'can', 'could', 'would',
+    'should', 'may', 'might', 'must', 'shall', 'need', 'want', 'like', 'know', 'think'
+})
+
+
+def load_stop_words(path, include_defaults=True):
+    """
+    Load a stop-word set from a UTF-8 text file (one word per line, '#' starts a comment)
+    """
+    words = set(DEFAULT_STOP_WORDS) if include_defaults else set()
+
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            word = line.split('#', 1)[0].strip().lower()
+            if word:
+                words.add(word)
+
+    return frozenset(words)
+
+
+class Tokenizer:
+    """Keyword tokenizer for Korean/English video titles, descriptions and tags"""
+
+    def __init__(self, stop_words=None, min_length=3, strip_particles=False):
+        self.stop_words = frozenset(stop_words) if stop_words is not None else DEFAULT_STOP_WORDS
+        self.min_length = min_length
+        self.strip_particles = strip_particles
+
+    @classmethod
+    def from_file(cls, path, include_defaults=True, **kwargs):
+        """Create a tokenizer whose stop words are loaded from a file"""
+        return cls(stop_words=load_stop_words(path, include_defaults), **kwargs)
+
+    def iter_tokens(self, text):
+        """Yield keywords from a single text"""
+        if not text:
+            return
+
+        stop_words = self.stop_words
+        min_length = self.min_length
+
+        for match in WORD_PATTERN.finditer(str(text).lower()):
+            word = match.group()
+
+            if self.strip_particles:
+                word = self._strip_particle(word)
+
+            if len(word) >= min_length and word not in stop_words:
+                yield word
+
+    def tokenize(self, text):
+        """Return keywords from a single text as a list"""
+        return list(self.iter_tokens(text))
+
+    def tokenize_many(self, texts):
+        """Stream keywords from many texts without building intermediate lists"""
+        for text in texts:
+            yield from self.iter_tokens(text)
+
+    def _strip_particle(self, word):
+        """
+        Remove a trailing Korean particle from a Hangul word
+
+        Many words end in a syllable that is also a particle (e.g. 고양이), so
+        the particle is only removed when the remaining stem is still long
+        enough to be a keyword (at least min_length characters). Otherwise the
+        word is kept whole instead of being cut and then dropped.
+        """
+        if not HANGUL_WORD_PATTERN.match(word):
+            return word
+
+        match = PARTICLE_PATTERN.match(word)
+        if match and len(match.group(1)) >= self.min_length:
+            return match.group(1)
+        return word
+
+
+# Shared default tokenizer used across the app
+default_tokenizer = Tokenizer()
+
+
+def tokenize(text):
+    """Tokenize a single text with the default tokenizer"""
+    return default_tokenizer.tokenize(text)
+
+
+def tokenize_many(texts):
+    """Stream tokens from many texts with the default tokenizer"""
+    return default_tokenizer.tokenize_many(texts)
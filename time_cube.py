@@ -0,0 +1,177 @@
+import numpy as np
+import pandas as pd
+
+from time_features import local_time
+
+WEEKDAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+CUBE_METRICS = ('view_count', 'like_count', 'comment_count', 'engagement_rate')
+CUBE_AXES = ('month', 'weekday', 'hour', 'is_short')
+SLOT_METRICS = ('view_count', 'engagement_rate')
+# Pseudo-videos at the channel mean added to every weekday x hour slot
+SLOT_PRIOR_STRENGTH = 5
+
+
+def _group_medians(groups, values, counts):
+    """Median of values per group (NaN for empty groups) from one sort"""
+    order = np.lexsort((values, groups))
+    ordered = values[order]
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    filled = counts > 0
+    low = starts + (counts - 1) // 2
+    high = starts + counts // 2
+
+    medians = np.full(len(counts), np.nan)
+    medians[filled] = (ordered[low[filled]] + ordered[high[filled]]) / 2
+    return medians
+
+
+class TimeBucketCube:
+    """Pre-aggregated month x weekday x hour x video type cube built once per dataset"""
+
+    def __init__(self, df, metrics=CUBE_METRICS):
+        self.metrics = tuple(m for m in metrics if m in df.columns)
+        published = local_time(df['published_at'])
+
+        # Per-row slot codes, kept so row subsets can be aggregated without regrouping
+        month_number = (published.dt.year * 12 + published.dt.month - 1).to_numpy()
+        self.first_month = int(month_number.min()) if len(month_number) else 0
+        self.month = month_number - self.first_month if len(month_number) else month_number
+        self.weekday = published.dt.dayofweek.to_numpy()
+        self.hour = published.dt.hour.to_numpy()
+        self.is_short = df['is_short'].fillna(False).astype(bool).to_numpy().astype(np.int64)
+
+        n_months = int(self.month.max()) + 1 if len(self.month) else 0
+        self.shape = (n_months, 7, 24, 2)
+        self.month_labels = [self._month_label(self.first_month + i) for i in range(n_months)]
+
+        # Flat cell index per row, then one bincount per statistic
+        self.cell = np.ravel_multi_index(
+            (self.month, self.weekday, self.hour, self.is_short), self.shape
+        ) if len(self.month) else np.empty(0, dtype=np.int64)
+        size = int(np.prod(self.shape))
+
+        self.counts = np.bincount(self.cell, minlength=size).reshape(self.shape)
+        self.sums = {}
+        self.sumsq = {}
+        for metric in self.metrics:
+            values = np.nan_to_num(df[metric].to_numpy(dtype=float))
+            self.sums[metric] = np.bincount(self.cell, weights=values, minlength=size).reshape(self.shape)
+            self.sumsq[metric] = np.bincount(self.cell, weights=values ** 2, minlength=size).reshape(self.shape)
+
+    def aggregate(self, axes):
+        """
+        Collapse the cube onto the given axes (subset of month, weekday, hour, is_short)
+
+        Returns one row per non-empty cell with the count and the sum, mean and
+        standard deviation of every metric.
+        """
+        axes = tuple(a for a in CUBE_AXES if a in axes)
+        drop = tuple(i for i, a in enumerate(CUBE_AXES) if a not in axes)
+
+        counts = self.counts.sum(axis=drop)
+        sums = {m: self.sums[m].sum(axis=drop) for m in self.metrics}
+        sumsq = {m: self.sumsq[m].sum(axis=drop) for m in self.metrics}
+
+        return self._cells_to_frame(axes, counts, sums, sumsq)
+
+    def aggregate_rows(self, axes, df, row_mask):
+        """Aggregate only the selected rows onto the given axes using the cached slot codes"""
+        axes = tuple(a for a in CUBE_AXES if a in axes)
+        row_mask = np.asarray(row_mask, dtype=bool)
+        codes = {'month': self.month, 'weekday': self.weekday, 'hour': self.hour, 'is_short': self.is_short}
+        shape = tuple(self.shape[CUBE_AXES.index(a)] for a in axes)
+        size = int(np.prod(shape))
+
+        cell = np.ravel_multi_index(tuple(codes[a][row_mask] for a in axes), shape)
+        counts = np.bincount(cell, minlength=size).reshape(shape)
+        sums = {}
+        sumsq = {}
+        for metric in self.metrics:
+            values = np.nan_to_num(df[metric].to_numpy(dtype=float)[row_mask])
+            sums[metric] = np.bincount(cell, weights=values, minlength=size).reshape(shape)
+            sumsq[metric] = np.bincount(cell, weights=values ** 2, minlength=size).reshape(shape)
+
+        return self._cells_to_frame(axes, counts, sums, sumsq)
+
+    def by_month(self, split_type=True):
+        """Monthly counts and metric statistics, optionally split by video type"""
+        return self.aggregate(('month', 'is_short') if split_type else ('month',))
+
+    def by_weekday(self):
+        """Counts and metric statistics per weekday (Monday first)"""
+        return self.aggregate(('weekday',))
+
+    def by_hour(self):
+        """Counts and metric statistics per hour of day"""
+        return self.aggregate(('hour',))
+
+    def by_weekday_hour(self):
+        """Counts and metric statistics per weekday x hour slot"""
+        return self.aggregate(('weekday', 'hour'))
+
+    def slot_matrix(self, df, metrics=SLOT_METRICS, prior_strength=SLOT_PRIOR_STRENGTH):
+        """
+        Dense 7 x 24 weekday x hour statistics over all videos
+
+        Returns counts plus, per metric, the mean, the median and a shrunk
+        mean that pulls low-count slots toward the channel mean:
+        (sum + prior_strength * channel_mean) / (count + prior_strength).
+        Empty slots are NaN in every statistic, so they are not mistaken for
+        average slots.
+        """
+        slot = self.weekday * 24 + self.hour
+        counts = np.bincount(slot, minlength=7 * 24)
+        matrix = {'count': counts.reshape(7, 24)}
+
+        for metric in metrics:
+            if metric not in df.columns:
+                continue
+            values = np.nan_to_num(df[metric].to_numpy(dtype=float))
+            sums = np.bincount(slot, weights=values, minlength=7 * 24)
+            channel_mean = values.mean() if len(values) else 0.0
+            with np.errstate(divide='ignore', invalid='ignore'):
+                means = np.where(counts > 0, sums / counts, np.nan)
+                shrunk = np.where(
+                    counts > 0,
+                    (sums + prior_strength * channel_mean) / (counts + prior_strength),
+                    np.nan
+                )
+
+            matrix[f'{metric}_mean'] = means.reshape(7, 24)
+            matrix[f'{metric}_median'] = _group_medians(slot, values, counts).reshape(7, 24)
+            matrix[f'{metric}_shrunk'] = shrunk.reshape(7, 24)
+
+        return matrix
+
+    def _cells_to_frame(self, axes, counts, sums, sumsq):
+        """Turn aggregated arrays into a DataFrame of non-empty cells"""
+        coords = np.nonzero(counts)
+        n = counts[coords].astype(float)
+
+        frame = {}
+        for axis, coord in zip(axes, coords):
+            if axis == 'month':
+                frame['month'] = [self.month_labels[i] for i in coord]
+            elif axis == 'weekday':
+                frame['weekday_index'] = coord
+                frame['day_of_week'] = [WEEKDAY_NAMES[i] for i in coord]
+            elif axis == 'hour':
+                frame['hour_of_day'] = coord
+            else:
+                frame['is_short'] = coord.astype(bool)
+
+        frame['count'] = counts[coords]
+        for metric in self.metrics:
+            total = sums[metric][coords]
+            mean = total / n
+            variance = np.maximum(sumsq[metric][coords] / n - mean ** 2, 0)
+            frame[f'{metric}_sum'] = total
+            frame[f'{metric}_mean'] = mean
+            frame[f'{metric}_std'] = np.sqrt(variance)
+
+        return pd.DataFrame(frame)
+
+    @staticmethod
+    def _month_label(month_number):
+        """Format an absolute month number as YYYY-MM"""
+        return f"{month_number // 12:04d}-{month_number % 12 + 1:02d}"
@@ -0,0 +1,42 @@
+import pandas as pd
+
+# Time features (hour, weekday, month, date) are shown in this timezone by default
+DEFAULT_DISPLAY_TIMEZONE = 'Asia/Seoul'
+DISPLAY_TIMEZONES = (
+    'Asia/Seoul', 'Asia/Tokyo', 'UTC', 'Europe/London', 'America/New_York', 'America/Los_Angeles'
+)
+
+
+def to_display_time(published, timezone=DEFAULT_DISPLAY_TIMEZONE):
+    """Convert a timestamp column to the display timezone in one vectorized step (naive values are UTC)"""
+    return pd.to_datetime(published, utc=True).dt.tz_convert(timezone)
+
+
+def local_time(published):
+    """Parse a timestamp column, keeping its timezone (naive values are taken as UTC)"""
+    published = pd.to_datetime(published)
+    if published.dt.tz is None:
+        published = published.dt.tz_localize('UTC')
+    return published
+
+
+def add_time_features(df, timezone=DEFAULT_DISPLAY_TIMEZONE):
+    """
+    Convert published_at to the display timezone and derive the time features from it
+
+    Overwrites day_of_week, hour_of_day, month, year and date_str (the
+    collector fills them in UTC), so switching timezone is a recompute over
+    the existing frame rather than a new collection. Modifies df in place.
+    """
+    if df.empty:
+        return df
+
+    published = to_display_time(df['published_at'], timezone)
+    df['published_at'] = published
+    df['day_of_week'] = published.dt.day_name()
+    df['hour_of_day'] = published.dt.hour
+    df['month'] = published.dt.month
+    df['year'] = published.dt.year
+    # Day-precision cast of the local wall time; far cheaper than strftime per row
+    df['date_str'] = published.dt.tz_localize(None).to_numpy(dtype='datetime64[D]').astype(str)
+    return df
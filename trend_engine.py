@@ -0,0 +1,316 @@
+import warnings
+from datetime import datetime, timezone
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+from analysis_cache import memoized
+from time_features import local_time
+
+# Months compared against the rest of the history for "recent" growth
+RECENT_MONTHS = 3
+# Window of the rolling month-over-month growth rate
+ROLLING_WINDOW = 3
+# Forecasts fit at most this many trailing months
+FORECAST_LOOKBACK_MONTHS = 24
+FORECAST_HORIZON = 3
+PREDICTION_LEVEL = 0.8
+# Uploads collect most of their lifetime views in their first weeks, so a
+# month only counts toward growth and forecasts once it ended this long ago
+SETTLE_DAYS = 30
+
+SERIES_METRICS = ('view_count', 'like_count', 'comment_count')
+
+
+def _month_numbers(published):
+    """Absolute month number (year * 12 + month - 1) per row"""
+    published = pd.to_datetime(published)
+    return (published.dt.year * 12 + published.dt.month - 1).to_numpy()
+
+
+def _month_label(month_number):
+    """Format an absolute month number as YYYY-MM"""
+    return f"{month_number // 12:04d}-{month_number % 12 + 1:02d}"
+
+
+def _reference_months(now, tz):
+    """
+    Month number of `now` in timezone tz and the first month not yet settled
+
+    Months before the second value ended at least SETTLE_DAYS before now.
+    """
+    now = pd.Timestamp(now)
+    if now.tzinfo is None:
+        now = now.tz_localize('UTC')
+    now = now.tz_convert(tz)
+    settle = now - pd.Timedelta(days=SETTLE_DAYS)
+    return now.year * 12 + now.month - 1, settle.year * 12 + settle.month - 1
+
+
+def _growth_pct(current, previous):
+    """Percentage change, 0 where the previous value is not positive"""
+    current = np.asarray(current, dtype=float)
+    previous = np.asarray(previous, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(previous > 0, (current - previous) / previous * 100, 0.0)
+
+
+def forecast_batch(series, horizon=FORECAST_HORIZON, level=PREDICTION_LEVEL):
+    """
+    Forecast many monthly series at once with a robust log-linear trend
+
+    series is a (channels x months) array of monthly totals, right-aligned on
+    each channel's latest month and NaN-padded on the left. Each row gets a
+    Theil-Sen fit (median of pairwise slopes) on log1p values, so a single
+    viral month does not tilt the trend. Prediction intervals use the robust
+    residual scale (1.4826 x MAD) with the usual linear-regression widening.
+
+    Returns (forecast, lower, upper), each of shape (channels x horizon).
+    """
+    y = np.log1p(np.asarray(series, dtype=float))
+    n_series, n_months = y.shape
+    x = np.arange(n_months, dtype=float)
+    valid = ~np.isnan(y)
+    n_points = valid.sum(axis=1)
+
+    # Median of pairwise slopes over all month pairs i < j present in a row
+    i, j = np.triu_indices(n_months, k=1)
+    with warnings.catch_warnings():
+        # Rows with fewer than two months have all-NaN slices
+        warnings.simplefilter('ignore', RuntimeWarning)
+        slope = np.nanmedian((y[:, j] - y[:, i]) / (x[j] - x[i]), axis=1) if len(i) else np.zeros(n_series)
+        slope = np.nan_to_num(slope)
+
+        intercept = np.nanmedian(y - slope[:, None] * x, axis=1)
+        residuals = y - (intercept[:, None] + slope[:, None] * x)
+        scale = 1.4826 * np.nanmedian(np.abs(residuals - np.nanmedian(residuals, axis=1)[:, None]), axis=1)
+        scale = np.nan_to_num(scale)
+
+    x_mean = np.nansum(np.where(valid, x, np.nan), axis=1) / np.maximum(n_points, 1)
+    sxx = np.nansum(np.where(valid, (x - x_mean[:, None]) ** 2, np.nan), axis=1)
+
+    future = n_months - 1 + np.arange(1, horizon + 1, dtype=float)
+    center = intercept[:, None] + slope[:, None] * future
+    with np.errstate(divide='ignore', invalid='ignore'):
+        leverage = np.where(
+            sxx[:, None] > 0,
+            (future - x_mean[:, None]) ** 2 / sxx[:, None],
+            0.0
+        )
+    z = NormalDist().inv_cdf(0.5 + level / 2)
+    half_width = z * scale[:, None] * np.sqrt(1 + 1 / np.maximum(n_points, 1)[:, None] + leverage)
+
+    forecast = np.expm1(center)
+    lower = np.maximum(np.expm1(center - half_width), 0)
+    upper = np.expm1(center + half_width)
+
+    # Rows without data forecast nothing
+    empty = n_points == 0
+    for values in (forecast, lower, upper):
+        values[empty] = np.nan
+    return forecast, lower, upper
+
+
+class TrendEngine:
+    """
+    Monthly series, growth, upload-gap statistics and forecasts for one dataset
+
+    Totals are lifetime metrics grouped by upload month, so the current month
+    and months whose uploads are still collecting views (ended less than
+    SETTLE_DAYS ago) read low. The dense series runs through the current
+    month, but growth and forecasts only use the settled months before them.
+    The current month is taken from `now` (default: the current time) when
+    the engine is built and is not refreshed afterwards.
+    """
+
+    def __init__(self, df, now=None):
+        self.n_videos = len(df)
+        self.now = pd.Timestamp(now or datetime.now(timezone.utc))
+        if self.n_videos == 0:
+            self.first_month = 0
+            self.n_settled = 0
+            self.month_labels = []
+            self.counts = np.zeros(0, dtype=np.int64)
+            self.sums = {metric: np.zeros(0) for metric in SERIES_METRICS}
+            self.published_ns = np.zeros(0, dtype=np.int64)
+            return
+
+        # Months follow the timestamps' own (display) timezone
+        published = local_time(df['published_at'])
+        month = _month_numbers(published)
+        current_month, settled_end = _reference_months(self.now, published.dt.tz)
+        self.first_month = int(month.min())
+        offset = month - self.first_month
+        # Through the current month, so a channel that stopped uploading trails off in zeros
+        n_months = max(int(offset.max()), current_month - self.first_month) + 1
+        self.n_settled = int(np.clip(settled_end - self.first_month, 0, n_months))
+
+        # Dense monthly series: months without uploads are zero, not missing
+        self.month_labels = [_month_label(self.first_month + i) for i in range(n_months)]
+        self.counts = np.bincount(offset, minlength=n_months)
+        self.sums = {}
+        for metric in SERIES_METRICS:
+            if metric in df.columns:
+                values = np.nan_to_num(df[metric].to_numpy(dtype=float))
+                self.sums[metric] = np.bincount(offset, weights=values, minlength=n_months)
+
+        utc = published.dt.tz_convert('UTC').dt.tz_localize(None)
+        self.published_ns = np.sort(utc.to_numpy(dtype='datetime64[ns]').astype(np.int64))
+
+    @memoized
+    def monthly_series(self, metric='view_count'):
+        """
+        Dense monthly series with uploads, totals, averages and rolling growth
+
+        rolling_growth_pct is the mean month-over-month growth of the metric
+        total over the last ROLLING_WINDOW months; settled is False for the
+        recent months whose totals are still growing.
+        """
+        totals = self.sums.get(metric, np.zeros(len(self.counts)))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            averages = np.where(self.counts > 0, totals / self.counts, 0.0)
+
+        growth = np.zeros(len(totals))
+        if len(totals) > 1:
+            growth[1:] = _growth_pct(totals[1:], totals[:-1])
+
+        series = pd.DataFrame({
+            'month': self.month_labels,
+            'uploads': self.counts,
+            'total': totals,
+            'average': averages,
+            'growth_pct': growth,
+            'settled': np.arange(len(totals)) < self.n_settled
+        })
+        series['rolling_growth_pct'] = series['growth_pct'].rolling(ROLLING_WINDOW, min_periods=1).mean()
+        return series
+
+    @memoized
+    def growth_summary(self, metric='view_count'):
+        """
+        Recent growth of a metric's settled monthly totals
+
+        recent_growth_pct compares the mean of the last RECENT_MONTHS settled
+        months with the mean of the months before them; month_growth_pct
+        compares the last settled month (through_month) with the one before.
+        """
+        totals = self.sums.get(metric, np.zeros(len(self.counts)))[:self.n_settled]
+        if len(totals) < RECENT_MONTHS:
+            return None
+
+        counts = self.counts[:self.n_settled]
+        recent = totals[-RECENT_MONTHS:]
+        older = totals[:-RECENT_MONTHS] if len(totals) > RECENT_MONTHS else totals[:RECENT_MONTHS]
+
+        return {
+            'recent_growth_pct': float(_growth_pct(recent.mean(), older.mean())),
+            'month_growth_pct': float(_growth_pct(totals[-1], totals[-2])),
+            'recent_uploads': int(counts[-RECENT_MONTHS:].sum()),
+            'rolling_growth_pct': float(
+                self.monthly_series(metric)['rolling_growth_pct'].iloc[self.n_settled - 1]
+            ),
+            'through_month': self.month_labels[self.n_settled - 1]
+        }
+
+    @memoized
+    def upload_gaps(self):
+        """Statistics of the days between consecutive uploads (None for fewer than 2 videos)"""
+        if len(self.published_ns) < 2:
+            return None
+
+        gaps = np.diff(self.published_ns) / 86_400e9
+        return {
+            'mean_days': float(gaps.mean()),
+            'median_days': float(np.median(gaps)),
+            'p90_days': float(np.percentile(gaps, 90)),
+            'max_days': float(gaps.max()),
+            'std_days': float(gaps.std()),
+            'uploads_per_week': float(7 / gaps.mean()) if gaps.mean() > 0 else None
+        }
+
+    @memoized
+    def forecast(self, metric='view_count', horizon=FORECAST_HORIZON, level=PREDICTION_LEVEL):
+        """
+        Forecast the totals of the months after the current one with prediction intervals
+
+        The trend is fit on the settled months only and projected across the
+        unsettled ones.
+        """
+        totals = self.sums.get(metric, np.zeros(len(self.counts)))[:self.n_settled]
+        totals = totals[-FORECAST_LOOKBACK_MONTHS:]
+        last_month = self.first_month + len(self.counts) - 1
+        unsettled = len(self.counts) - self.n_settled
+
+        if len(totals) < RECENT_MONTHS:
+            return pd.DataFrame(columns=['month', 'forecast', 'lower', 'upper'])
+
+        forecast, lower, upper = forecast_batch(totals[None, :], horizon=unsettled + horizon, level=level)
+        return pd.DataFrame({
+            'month': [_month_label(last_month + i) for i in range(1, horizon + 1)],
+            'forecast': forecast[0, unsettled:],
+            'lower': lower[0, unsettled:],
+            'upper': upper[0, unsettled:]
+        })
+
+
+def forecast_channels(channel_frames, metric='view_count', horizon=FORECAST_HORIZON,
+                      level=PREDICTION_LEVEL, lookback=FORECAST_LOOKBACK_MONTHS, now=None):
+    """
+    Forecast many channels in one vectorized call
+
+    channel_frames maps a channel name to its video DataFrame (published_at
+    plus the metric). Each channel's monthly totals are right-aligned on its
+    last settled month as of `now` (default: the current time), so channels
+    that stopped uploading carry zeros up to it. Returns one row per channel
+    and forecast step (the months after the current one) with the month
+    label, forecast and interval bounds.
+    """
+    now = now or datetime.now(timezone.utc)
+    names = list(channel_frames)
+    matrix = np.full((len(names), lookback), np.nan)
+    current_months = []
+    unsettled = []
+
+    for row, name in enumerate(names):
+        df = channel_frames[name]
+        if df is None or len(df) == 0 or metric not in df.columns:
+            current_months.append(None)
+            unsettled.append(0)
+            continue
+        published = local_time(df['published_at'])
+        month = _month_numbers(published)
+        current_month, settled_end = _reference_months(now, published.dt.tz)
+        start = settled_end - lookback
+        offset = month - start
+        keep = (offset >= 0) & (offset < lookback)
+        matrix[row] = np.bincount(
+            offset[keep],
+            weights=np.nan_to_num(df[metric].to_numpy(dtype=float))[keep],
+            minlength=lookback
+        )
+        # Months before the channel's first upload are missing, not zero
+        first_offset = int(month.min()) - start
+        if first_offset > 0:
+            matrix[row, :first_offset] = np.nan
+        current_months.append(current_month)
+        unsettled.append(current_month - settled_end + 1)
+
+    # Project every row across its own unsettled months before the forecast steps
+    forecast, lower, upper = forecast_batch(matrix, horizon=max(unsettled, default=0) + horizon, level=level)
+
+    rows = []
+    for row, name in enumerate(names):
+        if current_months[row] is None:
+            continue
+        for step in range(horizon):
+            column = unsettled[row] + step
+            rows.append({
+                'channel': name,
+                'step': step + 1,
+                'month': _month_label(current_months[row] + step + 1),
+                'forecast': forecast[row, column],
+                'lower': lower[row, column],
+                'upper': upper[row, column]
+            })
+    return pd.DataFrame(rows, columns=['channel', 'step', 'month', 'forecast', 'lower', 'upper'])
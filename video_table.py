@@ -0,0 +1,169 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+from analysis_cache import memoized
+from search_index import NgramIndex
+
+TABLE_COLUMNS = ('title', 'published_at', 'view_count', 'like_count', 'comment_count',
+                 'duration_formatted', 'is_short', 'tags')
+SORT_COLUMNS = ('published_at', 'view_count', 'like_count', 'comment_count')
+SEARCH_FIELDS = ('title', 'description', 'tags')
+DEFAULT_PAGE_SIZE = 50
+
+
+class VideoTable:
+    """
+    Detailed-data grid backed by per-column sort indexes built once per dataset
+
+    Range filters and sorting on the indexed columns use binary search over
+    the presorted values; only the requested page is materialized as a frame.
+    """
+
+    def __init__(self, df):
+        self.df = df.reset_index(drop=True)
+        self.n_rows = len(self.df)
+
+        if 'is_short' in self.df.columns:
+            self.is_short = self.df['is_short'].fillna(False).astype(bool).to_numpy()
+        else:
+            self.is_short = np.zeros(self.n_rows, dtype=bool)
+        self._search_indexes = {}
+        # Date filters are calendar days in the timestamps' own (display) timezone
+        self.timezone = None
+        if 'published_at' in self.df.columns and self.n_rows:
+            self.timezone = pd.to_datetime(self.df['published_at']).dt.tz
+
+        # column -> (row order, values in that order)
+        self._sorted = {}
+        for column in SORT_COLUMNS:
+            if column in self.df.columns:
+                values = self._sort_values(column)
+                order = np.argsort(values, kind='stable')
+                self._sorted[column] = (order, values[order])
+
+    def search_index(self, fields=('title',)):
+        """Get the n-gram search index over the given text fields, building it on first use"""
+        fields = tuple(f for f in SEARCH_FIELDS if f in fields and f in self.df.columns)
+        index = self._search_indexes.get(fields)
+        if index is None:
+            columns = [self.df[f].map(self._field_text) for f in fields]
+            documents = ['\n'.join(parts) for parts in zip(*columns)] if columns else [''] * self.n_rows
+            index = self._search_indexes[fields] = NgramIndex(documents)
+        return index
+
+    @staticmethod
+    def _field_text(value):
+        """Searchable text of a title, description or tag list"""
+        if isinstance(value, (list, tuple)):
+            return ' '.join(str(v) for v in value)
+        return value if isinstance(value, str) else ''
+
+    def _sort_values(self, column):
+        """Numeric sort keys for a column (timestamps as int64 nanoseconds)"""
+        if column == 'published_at':
+            published = pd.to_datetime(self.df[column], utc=True).dt.tz_localize(None)
+            return published.to_numpy(dtype='datetime64[ns]').astype(np.int64)
+        return pd.to_numeric(self.df[column], errors='coerce').fillna(0).to_numpy(dtype=float)
+
+    def _bounds(self, column, low=None, high=None):
+        """Slice of the column's sort order holding values in [low, high]"""
+        _, values = self._sorted[column]
+        start = int(np.searchsorted(values, low, side='left')) if low is not None else 0
+        stop = int(np.searchsorted(values, high, side='right')) if high is not None else len(values)
+        return start, max(start, stop)
+
+    def range_rows(self, column, low=None, high=None):
+        """Row positions whose column value lies in [low, high], in ascending order of that column"""
+        order, _ = self._sorted[column]
+        start, stop = self._bounds(column, low, high)
+        return order[start:stop]
+
+    def _date_bounds(self, date_range):
+        """Convert a (start, end) date selection into inclusive int64 nanosecond (UTC) bounds"""
+        if not date_range:
+            return None, None
+        dates = list(date_range)
+        low = self._day_start(dates[0])
+        high = None
+        if len(dates) > 1:
+            high = self._day_start(pd.Timestamp(dates[1]) + pd.Timedelta(days=1)) - 1
+        return low, high
+
+    def _day_start(self, date):
+        """Nanosecond timestamp of midnight of a calendar day in the table's timezone"""
+        start = pd.Timestamp(date)
+        if self.timezone is not None:
+            start = start.tz_localize(self.timezone)
+        return start.value
+
+    @memoized
+    def query(self, video_type=None, min_views=0, date_range=None, search=None,
+              sort_by='published_at', descending=True, search_fields=('title',)):
+        """
+        Return the row positions matching the filters, in display order
+
+        video_type is None (all), True (Shorts) or False (long-form). search
+        is matched literally against search_fields, and every whitespace
+        separated term must match. The returned array is cached and shared,
+        so callers must not modify it.
+        """
+        if sort_by not in self._sorted:
+            sort_by = next(iter(self._sorted), None)
+        if sort_by is None:
+            return np.arange(self.n_rows)
+
+        ranges = []
+        if min_views:
+            ranges.append(('view_count', min_views, None))
+        low, high = self._date_bounds(date_range)
+        if low is not None or high is not None:
+            ranges.append(('published_at', low, high))
+
+        order, _ = self._sorted[sort_by]
+        start, stop = 0, self.n_rows
+        selected = None
+
+        for column, low, high in ranges:
+            if column not in self._sorted:
+                continue
+            if column == sort_by:
+                # Filtering on the sort column just narrows the slice
+                range_start, range_stop = self._bounds(column, low, high)
+                start, stop = max(start, range_start), min(stop, range_stop)
+                continue
+            keep = np.zeros(self.n_rows, dtype=bool)
+            keep[self.range_rows(column, low, high)] = True
+            selected = keep if selected is None else selected & keep
+
+        if video_type is not None:
+            keep = self.is_short == video_type
+            selected = keep if selected is None else selected & keep
+
+        if search:
+            keep = self.search_index(search_fields).mask(search)
+            selected = keep if selected is None else selected & keep
+
+        rows = order[start:max(start, stop)]
+        if selected is not None:
+            rows = rows[selected[rows]]
+        return rows[::-1] if descending else rows
+
+    @staticmethod
+    def page_count(rows, page_size=DEFAULT_PAGE_SIZE):
+        """Number of pages needed for the given rows (at least one)"""
+        return max(1, math.ceil(len(rows) / page_size))
+
+    def page(self, rows, page_number=1, page_size=DEFAULT_PAGE_SIZE, columns=TABLE_COLUMNS):
+        """Materialize one page (1-based) of the given rows with the selected columns"""
+        start = (max(page_number, 1) - 1) * page_size
+        page_rows = rows[start:start + page_size]
+        columns = [c for c in columns if c in self.df.columns]
+
+        page_df = self.df.iloc[page_rows][columns].copy()
+        if 'tags' in page_df.columns:
+            page_df['tags'] = page_df['tags'].map(
+                lambda tags: ', '.join(tags) if isinstance(tags, (list, tuple)) else tags
+            )
+        return page_df
@@ -1,17 +1,26 @@
 import os
 import time
 from datetime import datetime, timedelta
-import re
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 import isodate
 import urllib.parse
 
+from text_tokenizer import tokenize
+
 class YouTubeAnalyzer:
     def __init__(self, api_key):
         """Initialize YouTube Data API client"""
+        # Discovery client is heavy to import, so load it only once an API key is given
+        from googleapiclient.discovery import build
+        
         self.api_key = api_key
         self.youtube = build('youtube', 'v3', developerKey=api_key)
+        self.api_calls = 0
+    
+    def _execute(self, request):
+        """Execute an API request and count it towards quota usage"""
+        self.api_calls += 1
+        return request.execute()
         
     def get_channel_info(self, channel_identifier):
         """
@@ -27,7 +36,7 @@ class YouTubeAnalyzer:
                     part='snippet,statistics,contentDetails',
                     id=channel_identifier
                 )
-                response = request.execute()
+                response = self._execute(request)
                 if response['items']:
                     channel_data = response['items'][0]
             
@@ -37,7 +46,7 @@ class YouTubeAnalyzer:
                     part='snippet,statistics,contentDetails',
                     forHandle=channel_identifier
                 )
-                response = request.execute()
+                response = self._execute(request)
                 if response['items']:
                     channel_data = response['items'][0]
             
@@ -50,7 +59,7 @@ class YouTubeAnalyzer:
                     type='channel',
                     maxResults=5
                 )
-                search_response = search_request.execute()
+                search_response = self._execute(search_request)
                 
                 if search_response['items']:
                     # Get the first matching channel
@@ -59,7 +68,7 @@ class YouTubeAnalyzer:
                         part='snippet,statistics,contentDetails',
                         id=channel_id
                     )
-                    response = request.execute()
+                    response = self._execute(request)
                     if response['items']:
                         channel_data = response['items'][0]
             
@@ -93,9 +102,12 @@ class YouTubeAnalyzer:
         except Exception as e:
             raise Exception(f"Error getting channel info: {str(e)}")
     
-    def collect_all_videos(self, channel_id, max_results=1000, include_shorts=True, include_long_form=True, progress_callback=None):
+    def collect_all_videos(self, channel_id, max_results=1000, include_shorts=True, include_long_form=True,
+                           progress_callback=None, cancel_event=None, video_callback=None):
         """
         Collect all videos from a channel with detailed information
+        Stops early (returning what was collected) once cancel_event is set;
+        video_callback receives each enriched video as soon as it is collected
         """
         try:
             # Get channel info first
@@ -103,7 +115,7 @@ class YouTubeAnalyzer:
                 part='contentDetails',
                 id=channel_id
             )
-            channel_response = channel_request.execute()
+            channel_response = self._execute(channel_request)
             
             if not channel_response['items']:
                 raise Exception("Channel not found")
@@ -115,6 +127,9 @@ class YouTubeAnalyzer:
             collected_count = 0
             
             while collected_count < max_results:
+                if cancel_event is not None and cancel_event.is_set():
+                    break
+                
                 # Get playlist items (videos)
                 playlist_request = self.youtube.playlistItems().list(
                     part='snippet',
@@ -122,7 +137,7 @@ class YouTubeAnalyzer:
                     maxResults=min(50, max_results - collected_count),
                     pageToken=next_page_token
                 )
-                playlist_response = playlist_request.execute()
+                playlist_response = self._execute(playlist_request)
                 
                 if not playlist_response['items']:
                     break
@@ -135,7 +150,7 @@ class YouTubeAnalyzer:
                     part='snippet,statistics,contentDetails,status',
                     id=','.join(video_ids)
                 )
-                videos_response = videos_request.execute()
+                videos_response = self._execute(videos_request)
                 
                 for video in videos_response['items']:
                     try:
@@ -147,9 +162,14 @@ class YouTubeAnalyzer:
                         if not video_data['is_short'] and not include_long_form:
                             continue
                         
+                        # Enrich as we go so partial results are usable
+                        self._enrich_video_data([video_data])
                         videos.append(video_data)
                         collected_count += 1
                         
+                        if video_callback:
+                            video_callback(video_data)
+                        
                         if progress_callback:
                             progress_callback(collected_count, max_results, f"Collecting video data...")
                         
@@ -167,11 +187,8 @@ class YouTubeAnalyzer:
                 # Rate limiting
                 time.sleep(0.1)
             
-            # Enrich videos with additional analysis
             if progress_callback:
-                progress_callback(len(videos), len(videos), "Analyzing video data...")
-            
-            self._enrich_video_data(videos)
+                progress_callback(len(videos), len(videos), "Video data collected")
             
             return videos
             
@@ -257,7 +274,7 @@ class YouTubeAnalyzer:
             total_engagement = video['like_count'] + video['comment_count']
             video['engagement_rate'] = (total_engagement / video['view_count'] * 100) if video['view_count'] > 0 else 0
             
-            # Add time-based features
+            # Add time-based features (UTC; DataVisualizer recomputes them in the display timezone)
             pub_date = video['published_at']
             video['day_of_week'] = pub_date.strftime('%A')
             video['hour_of_day'] = pub_date.hour
@@ -275,21 +292,4 @@ class YouTubeAnalyzer:
     
     def _extract_keywords(self, text):
         """Extract keywords from text"""
-        if not text:
-            return []
-        
-        # Remove special characters and convert to lowercase
-        text = re.sub(r'[^\w\s가-힣]', ' ', text.lower())
-        
-        # Split into words and filter out short words
-        words = [word.strip() for word in text.split() if len(word.strip()) > 2]
-        
-        # Remove common stop words (Korean and English)
-        stop_words = {
-            '그리고', '하지만', '그래서', '그런데', '그러나', '또한', '그냥', '정말', '진짜', '너무',
-            'and', 'but', 'the', 'for', 'are', 'with', 'this', 'that', 'from', 'they', 'have',
-            'been', 'will', 'what', 'when', 'where', 'how', 'why', 'can', 'could', 'would',
-            'should', 'may', 'might', 'must', 'shall', 'need', 'want', 'like', 'know', 'think'
-        }
-        
-        return [word for word in words if word not in stop_words]
+        return tokenize(text)